@@ -30,16 +30,20 @@ Exit codes:
 
 import argparse
 import json
+import mmap
+import os
 import re
 import signal
+import stat
 import sys
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, TextIO, cast, override
 
-# JSON-compatible types
-type JsonValue = str | int | float | bool | None | list[JsonValue] | dict[str, JsonValue]
-type JsonDict = dict[str, JsonValue]
+# Per-line-type handlers, see parse_monster_file()
+type LineValidator = Callable[[list[str], str, int, ValidationResult], None]
+type LineParser = Callable[[list[str], Monster], None]
 
 # Handle broken pipe (e.g., when piping to head) - Unix only
 if hasattr(signal, "SIGPIPE"):
@@ -81,13 +85,20 @@ VALID_COLORS = DOCUMENTED_COLORS | EXTENDED_COLORS
 ###
 ### Regex patterns for validation
 ###
-DICE_PATTERN = re.compile(r"^\d+d\d+$")
 PROTECTION_PATTERN = re.compile(r"^\[[+-]\d+(,\d+d\d+)?\]$")
 # Damage can be (+N,NdM) or just (+N) for effects that don't deal damage
 DAMAGE_PATTERN = re.compile(r"^\([+-]\d+(,\d+d\d+)?\)$")
 SPELL_PCT_PATTERN = re.compile(r"SPELL_PCT_\d+")
-# Light radius can be negative (creature creates darkness)
-LIGHT_RADIUS_PATTERN = re.compile(r"^-?\d+$")
+
+###
+### Regex patterns for parsing (prefix matches with capture groups)
+###
+# (attack bonus, damage dice) of a B: line
+DAMAGE_VALUES_PATTERN = re.compile(r"\(([+-]\d+)(?:,(\d+d\d+))?\)")
+# [evasion bonus, protection dice] of a P: line
+PROTECTION_VALUES_PATTERN = re.compile(r"\[([+-]\d+)(?:,(\d+d\d+))?\]")
+# SPELL_PCT_X or POW_X token of an S: line
+SPELL_VALUE_PATTERN = re.compile(r"SPELL_PCT_(?P<freq>\d+)|POW_(?P<pow>\d+)")
 
 
 @dataclass
@@ -146,6 +157,24 @@ class Monster:
     description: str | None = None
 
 
+# Optional scalar fields of a Monster, in JSON export order
+MONSTER_SCALAR_FIELDS = (
+    "depth",
+    "rarity",
+    "symbol",
+    "color",
+    "speed",
+    "health_dice",
+    "light_radius",
+    "sleepiness",
+    "perception",
+    "stealth",
+    "will",
+    "evasion_bonus",
+    "protection_dice",
+)
+
+
 def parse_limits_file(filepath: Path) -> Limits | None:
     """Parse limits.txt and extract relevant limits.
 
@@ -156,13 +185,14 @@ def parse_limits_file(filepath: Path) -> Limits | None:
 
     max_monster_races = None
 
-    for line in filepath.read_text(encoding="latin-1").splitlines():
-        line = line.strip()
-        if line.startswith("M:R:"):
-            # M:R:656 - Maximum number of monster races
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_monster_races = int(parts[2])
+    with filepath.open(encoding="latin-1") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("M:R:"):
+                # M:R:656 - Maximum number of monster races
+                parts = line.split(":")
+                if len(parts) >= 3 and parts[2].isdecimal():
+                    max_monster_races = int(parts[2])
 
     if max_monster_races is None:
         return None
@@ -170,38 +200,69 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     return Limits(max_monster_races=max_monster_races)
 
 
-def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | None:
+def iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the raw lines of an open file through a read-only memory map.
+
+    The file is never copied into one large buffer; each line is sliced out
+    of the map as it is consumed, and callers decode only the lines they keep.
+    A pipe or other non-regular file cannot be mapped and is read line by line.
+
+    As in the game, a line ends only at a newline. Callers drop carriage
+    returns anywhere in it (the game skips control characters) and trailing
+    whitespace, but keep leading whitespace: records start in column 0, and
+    the game rejects indented lines.
+    """
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode):
+        yield from f
+        return
+    # mmap cannot map an empty file
+    if st.st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def is_integer(value: str) -> bool:
+    """Check for an integer with an optional leading minus sign (e.g. light radius)."""
+    return value[1:].isdecimal() if value[:1] == "-" else value.isdecimal()
+
+
+def is_dice(value: str) -> bool:
+    """Check for dice format (NdM)."""
+    count, sep, sides = value.partition("d")
+    return bool(sep) and count.isdecimal() and sides.isdecimal()
+
+
+def validate_n_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> int | None:
     """Validate N: line format and return the ID."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: N: line has {len(parts)} fields, expected 3: {line}")
         return None
 
     id_str = parts[1]
-    if not id_str.isdigit():
+    if not id_str.isdecimal():
         result.error(f"Line {lineno}: N: ID is not numeric: {id_str}")
         return None
 
     return int(id_str)
 
 
-def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_w_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate W: line format (depth : rarity)."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: W: line has {len(parts)} fields, expected 3: {line}")
         return
 
     depth, rarity = parts[1], parts[2]
-    if not depth.isdigit():
+    if not depth.isdecimal():
         result.error(f"Line {lineno}: W: depth is not numeric: {depth}")
-    if not rarity.isdigit():
+    if not rarity.isdecimal():
         result.error(f"Line {lineno}: W: rarity is not numeric: {rarity}")
 
 
-def validate_g_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_g_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate G: line format (symbol : color)."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: G: line has {len(parts)} fields, expected 3: {line}")
         return
@@ -214,7 +275,7 @@ def validate_g_line(line: str, lineno: int, result: ValidationResult) -> None:
         result.warning(f"Line {lineno}: G: color '{color}' not in documented color list")
 
 
-def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_i_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate I: line format (speed : health : light radius).
 
     Note: The documentation says "speed : health : mana : light radius" but
@@ -222,40 +283,37 @@ def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
     "speed : health dice : light radius" where light can be negative
     (indicating the creature creates darkness).
     """
-    parts = line.split(":")
     if len(parts) != 4:
         result.error(f"Line {lineno}: I: line has {len(parts)} fields, expected 4: {line}")
         return
 
     speed, health, light = parts[1], parts[2], parts[3]
 
-    if not speed.isdigit():
+    if not speed.isdecimal():
         result.error(f"Line {lineno}: I: speed is not numeric: {speed}")
 
-    if not DICE_PATTERN.match(health):
+    if not is_dice(health):
         result.error(f"Line {lineno}: I: health is not valid dice format (NdM): {health}")
 
     # Light radius can be negative (creature creates darkness around it)
-    if not LIGHT_RADIUS_PATTERN.match(light):
+    if not is_integer(light):
         result.error(f"Line {lineno}: I: light radius is not a valid integer: {light}")
 
 
-def validate_a_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_a_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate A: line format (sleepiness : perception : stealth : will)."""
-    parts = line.split(":")
     if len(parts) != 5:
         result.error(f"Line {lineno}: A: line has {len(parts)} fields, expected 5: {line}")
         return
 
     for i, name in enumerate(["sleepiness", "perception", "stealth", "will"], start=1):
         val = parts[i]
-        if not val.isdigit():
+        if not val.isdecimal():
             result.error(f"Line {lineno}: A: {name} is not numeric: {val}")
 
 
-def validate_p_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_p_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate P: line format ([evasion bonus, protection dice])."""
-    parts = line.split(":")
     if len(parts) != 2:
         result.error(f"Line {lineno}: P: line has {len(parts)} fields, expected 2: {line}")
         return
@@ -265,14 +323,13 @@ def validate_p_line(line: str, lineno: int, result: ValidationResult) -> None:
         result.error(f"Line {lineno}: P: invalid format, expected [+/-N] or [+/-N,NdM]: {pval}")
 
 
-def validate_b_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_b_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate B: line format (method : effect : damage).
 
     Note: The documentation says damage format is "(attack bonus, damage dice)"
     but in practice, some effects like TERRIFY only have the attack bonus
     without damage dice, e.g., "(+15)" instead of "(+15,1d6)".
     """
-    parts = line.split(":")
     # B: should have 2-4 fields (effect and damage are optional per docs)
     if len(parts) < 2 or len(parts) > 4:
         result.error(f"Line {lineno}: B: line has {len(parts)} fields, expected 2-4: {line}")
@@ -291,9 +348,8 @@ def validate_s_line_is_first(line: str, lineno: int, result: ValidationResult) -
         result.error(f"Line {lineno}: First S: line must contain SPELL_PCT_X: {line}")
 
 
-def parse_attack(line: str) -> Attack | None:
-    """Parse a B: line into an Attack object."""
-    parts = line.split(":")
+def parse_attack(parts: list[str]) -> Attack | None:
+    """Parse the fields of a B: line into an Attack object."""
     if len(parts) < 2:
         return None
 
@@ -305,7 +361,7 @@ def parse_attack(line: str) -> Attack | None:
     if len(parts) > 3:
         # Parse damage format: (+N,NdM) or (+N)
         damage_str = parts[3]
-        match = re.match(r"\(([+-]\d+)(?:,(\d+d\d+))?\)", damage_str)
+        match = DAMAGE_VALUES_PATTERN.match(damage_str)
         if match:
             attack_bonus = int(match.group(1))
             damage_dice = match.group(2)
@@ -315,7 +371,7 @@ def parse_attack(line: str) -> Attack | None:
 
 def parse_protection(pval: str) -> tuple[int | None, str | None]:
     """Parse a P: line protection value like [+1,1d4] or [+0]."""
-    match = re.match(r"\[([+-]\d+)(?:,(\d+d\d+))?\]", pval)
+    match = PROTECTION_VALUES_PATTERN.match(pval)
     if match:
         evasion_bonus = int(match.group(1))
         protection_dice = match.group(2)
@@ -329,16 +385,14 @@ def parse_spell_line(line: str, spell_info: SpellInfo) -> None:
     parts = [p.strip() for p in content.split("|")]
 
     for part in parts:
-        # Check for SPELL_PCT_X
-        match = re.match(r"SPELL_PCT_(\d+)", part)
+        # Check for SPELL_PCT_X or POW_X with a single match
+        match = SPELL_VALUE_PATTERN.match(part)
         if match:
-            spell_info.frequency = int(match.group(1))
-            continue
-
-        # Check for POW_X
-        match = re.match(r"POW_(\d+)", part)
-        if match:
-            spell_info.power = int(match.group(1))
+            freq, power = match.group("freq", "pow")
+            if freq is not None:
+                spell_info.frequency = int(freq)
+            else:
+                spell_info.power = int(power)
             continue
 
         # Otherwise it's a spell type
@@ -346,175 +400,126 @@ def parse_spell_line(line: str, spell_info: SpellInfo) -> None:
             spell_info.spells.append(part)
 
 
-def parse_monsters(filepath: Path) -> list[Monster]:
-    """Parse monster.txt and return a list of Monster objects."""
-    if not filepath.exists():
-        return []
+def parse_w_line(parts: list[str], monster: Monster) -> None:
+    """Parse W: line (depth : rarity) into monster."""
+    if len(parts) >= 3:
+        if parts[1].isdecimal():
+            monster.depth = int(parts[1])
+        if parts[2].isdecimal():
+            monster.rarity = int(parts[2])
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
-    monsters: list[Monster] = []
-    current_monster: Monster | None = None
 
-    for line in lines:
-        line = line.strip()
+def parse_g_line(parts: list[str], monster: Monster) -> None:
+    """Parse G: line (symbol : color) into monster."""
+    if len(parts) >= 3:
+        monster.symbol = parts[1]
+        monster.color = parts[2]
 
-        # Skip empty lines and comments
-        if not line or line.startswith("#") or line.startswith("V:"):
-            continue
 
-        # N: line - start of new monster
-        if line.startswith("N:"):
-            # Save previous monster
-            if current_monster is not None:
-                monsters.append(current_monster)
+def parse_i_line(parts: list[str], monster: Monster) -> None:
+    """Parse I: line (speed : health : light) into monster."""
+    if len(parts) >= 4:
+        if parts[1].isdecimal():
+            monster.speed = int(parts[1])
+        if is_dice(parts[2]):
+            monster.health_dice = parts[2]
+        if is_integer(parts[3]):
+            monster.light_radius = int(parts[3])
 
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[1].isdigit():
-                current_monster = Monster(id=int(parts[1]), name=parts[2])
-            continue
 
-        if current_monster is None:
-            continue
+def parse_a_line(parts: list[str], monster: Monster) -> None:
+    """Parse A: line (sleepiness : perception : stealth : will) into monster."""
+    if len(parts) >= 5:
+        if parts[1].isdecimal():
+            monster.sleepiness = int(parts[1])
+        if parts[2].isdecimal():
+            monster.perception = int(parts[2])
+        if parts[3].isdecimal():
+            monster.stealth = int(parts[3])
+        if parts[4].isdecimal():
+            monster.will = int(parts[4])
 
-        # W: depth : rarity
-        if line.startswith("W:"):
-            parts = line.split(":")
-            if len(parts) >= 3:
-                if parts[1].isdigit():
-                    current_monster.depth = int(parts[1])
-                if parts[2].isdigit():
-                    current_monster.rarity = int(parts[2])
-
-        # G: symbol : color
-        elif line.startswith("G:"):
-            parts = line.split(":")
-            if len(parts) >= 3:
-                current_monster.symbol = parts[1]
-                current_monster.color = parts[2]
-
-        # I: speed : health : light
-        elif line.startswith("I:"):
-            parts = line.split(":")
-            if len(parts) >= 4:
-                if parts[1].isdigit():
-                    current_monster.speed = int(parts[1])
-                if DICE_PATTERN.match(parts[2]):
-                    current_monster.health_dice = parts[2]
-                if LIGHT_RADIUS_PATTERN.match(parts[3]):
-                    current_monster.light_radius = int(parts[3])
-
-        # A: sleepiness : perception : stealth : will
-        elif line.startswith("A:"):
-            parts = line.split(":")
-            if len(parts) >= 5:
-                if parts[1].isdigit():
-                    current_monster.sleepiness = int(parts[1])
-                if parts[2].isdigit():
-                    current_monster.perception = int(parts[2])
-                if parts[3].isdigit():
-                    current_monster.stealth = int(parts[3])
-                if parts[4].isdigit():
-                    current_monster.will = int(parts[4])
-
-        # P: [evasion, protection]
-        elif line.startswith("P:"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                evasion, protection = parse_protection(parts[1])
-                current_monster.evasion_bonus = evasion
-                current_monster.protection_dice = protection
-
-        # B: attack
-        elif line.startswith("B:"):
-            attack = parse_attack(line)
-            if attack:
-                current_monster.attacks.append(attack)
-
-        # S: spells
-        elif line.startswith("S:"):
-            if current_monster.spell_info is None:
-                current_monster.spell_info = SpellInfo()
-            parse_spell_line(line, current_monster.spell_info)
-
-        # F: flags
-        elif line.startswith("F:"):
-            content = line[2:]  # Remove "F:"
-            flags = [f.strip() for f in content.split("|") if f.strip()]
-            current_monster.flags.extend(flags)
-
-        # D: description
-        elif line.startswith("D:"):
-            content = line[2:].strip()  # Remove "D:" and strip whitespace
-            if current_monster.description is None:
-                current_monster.description = content
-            else:
-                current_monster.description += " " + content
 
-    if current_monster is not None:
-        monsters.append(current_monster)
+def parse_p_line(parts: list[str], monster: Monster) -> None:
+    """Parse P: line ([evasion, protection]) into monster."""
+    if len(parts) >= 2:
+        evasion, protection = parse_protection(parts[1])
+        monster.evasion_bonus = evasion
+        monster.protection_dice = protection
 
-    return monsters
 
+def parse_b_line(parts: list[str], monster: Monster) -> None:
+    """Parse B: line (attack) into monster."""
+    attack = parse_attack(parts)
+    if attack:
+        monster.attacks.append(attack)
 
-def export_monsters_to_json(monsters: list[Monster]) -> str:
-    """Export monsters to a JSON string."""
 
-    def clean_dict(d: JsonDict) -> JsonDict:
-        """Recursively remove None values and empty collections from a dict."""
-        result: JsonDict = {}
-        for k, v in d.items():
-            if v is None or v == [] or v == "":
-                continue
-            if isinstance(v, dict):
-                cleaned = clean_dict(v)
-                if cleaned:  # Only include non-empty dicts
-                    result[k] = cleaned
-            elif isinstance(v, list):
-                # Clean each item if it's a dict
-                cleaned_list: list[JsonValue] = []
-                for item in v:
-                    if isinstance(item, dict):
-                        cleaned_item = clean_dict(item)
-                        if cleaned_item:
-                            cleaned_list.append(cleaned_item)
-                    elif item is not None:
-                        cleaned_list.append(item)
-                if cleaned_list:
-                    result[k] = cleaned_list
-            else:
-                result[k] = v
-        return result
+def parse_s_line(line: str, monster: Monster) -> None:
+    """Parse S: line (spells) into monster."""
+    if monster.spell_info is None:
+        monster.spell_info = SpellInfo()
+    parse_spell_line(line, monster.spell_info)
 
-    def monster_to_dict(monster: Monster) -> JsonDict:
-        """Convert a Monster to a dict, removing None values."""
-        d = clean_dict(asdict(monster))
-        if "flags" in d and isinstance(d["flags"], list):
-            d["flags"] = cast(JsonValue, sorted(cast(list[str], d["flags"])))
-        if "spell_info" in d and isinstance(d["spell_info"], dict):
-            spell_info = d["spell_info"]
-            if "spells" in spell_info and isinstance(spell_info["spells"], list):
-                spell_info["spells"] = cast(JsonValue, sorted(cast(list[str], spell_info["spells"])))
-        return d
 
-    data = {"monsters": [monster_to_dict(m) for m in monsters]}
-    return json.dumps(data, indent=2, ensure_ascii=False)
+def parse_f_line(line: str, monster: Monster) -> None:
+    """Parse F: line (flag | flag | etc) into monster."""
+    content = line[2:]  # Remove "F:"
+    flags = [f.strip() for f in content.split("|") if f.strip()]
+    monster.flags.extend(flags)
 
 
-def validate_monster_file(filepath: Path, limits: Limits | None = None) -> ValidationResult:
-    """Validate the entire monster.txt file.
+def finish_monster(monster: Monster, description_parts: list[str]) -> None:
+    """Finalize a monster record once all of its lines have been read.
+
+    Joins the collected D: fragments into the description, and sorts and
+    deduplicates the flags gathered from all F: lines and the spell types
+    gathered from all S: lines.
+    """
+    if description_parts:
+        monster.description = " ".join(description_parts)
+    if monster.flags:
+        monster.flags = sorted(set(monster.flags))
+    if monster.spell_info is not None and monster.spell_info.spells:
+        monster.spell_info.spells = sorted(set(monster.spell_info.spells))
+
+
+def parse_monster_file(
+    filepath: Path,
+    limits: Limits | None = None,
+    *,
+    validate: bool = True,
+    build_records: bool = True,
+) -> tuple[list[Monster], ValidationResult]:
+    """Parse and/or validate the entire monster.txt file in a single pass.
+
+    Each line is read and split once, then validated and applied to the
+    current monster record. Only the work for the requested modes is done.
 
     Args:
         filepath: Path to monster.txt file.
         limits: Optional limits from limits.txt. If provided, validates
                 monster count and IDs against the maximum allowed.
+        validate: Whether to check the file format and integrity.
+        build_records: Whether to build the monster records.
+
+    Returns:
+        The parsed monster records (empty unless build_records is set) and
+        the validation result (without checks unless validate is set).
     """
     result = ValidationResult()
+    monsters: list[Monster] = []
 
-    if not filepath.exists():
+    # Open once and let a missing file surface here, instead of a separate stat
+    try:
+        f = filepath.open("rb")
+    except FileNotFoundError:
         result.error(f"Monster file not found: {filepath}")
-        return result
+        return monsters, result
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
+    current_monster: Monster | None = None
+    # D: fragments of the current monster, joined once the monster is complete
+    description_parts: list[str] = []
 
     # Track state. Maps id -> line number.
     ids_seen: dict[int, int] = {}
@@ -524,84 +529,117 @@ def validate_monster_file(filepath: Path, limits: Limits | None = None) -> Valid
     in_monster = False
     first_s_in_monster = True
 
-    for lineno, line in enumerate(lines, start=1):
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
+    # Validator and record parser for each colon-separated line type, keyed by
+    # line prefix. V:, N:, S:, F: and D: lines are handled inline.
+    line_handlers: dict[str, tuple[LineValidator, LineParser]] = {
+        "W:": (validate_w_line, parse_w_line),
+        "G:": (validate_g_line, parse_g_line),
+        "I:": (validate_i_line, parse_i_line),
+        "A:": (validate_a_line, parse_a_line),
+        "P:": (validate_p_line, parse_p_line),
+        "B:": (validate_b_line, parse_b_line),
+    }
+
+    with f:
+        # Walk the raw lines through a memory map; only data lines are decoded
+        for lineno, raw_line in enumerate(iter_lines(f), start=1):
+            # Drop carriage returns and trailing whitespace (see iter_lines())
+            raw_line = raw_line.replace(b"\r", b"").rstrip()
+
+            # Skip empty lines and comments before decoding
+            if not raw_line or raw_line[:1] == b"#":
+                continue
 
-        # Version stamp
-        if line.startswith("V:"):
-            has_version = True
-            continue
+            line = raw_line.decode("latin-1")
+            prefix = line[:2]
 
-        # N: line - start of monster entry
-        if line.startswith("N:"):
-            monster_id = validate_n_line(line, lineno, result)
-            if monster_id is not None:
-                # Check for duplicates
-                if monster_id in ids_seen:
-                    result.error(
-                        f"Line {lineno}: Duplicate ID {monster_id} " +
-                        f"(first seen at line {ids_seen[monster_id]})"
-                    )
-                else:
-                    ids_seen[monster_id] = lineno
+            # Version stamp
+            if prefix == "V:":
+                has_version = True
+                continue
 
-                # Check IDs are increasing
-                if monster_id <= prev_id:
-                    result.error(
-                        f"Line {lineno}: ID {monster_id} is not greater than previous ID {prev_id} " +
-                        "(IDs must be strictly increasing)"
-                    )
-                prev_id = monster_id
+            # N: line - start of monster entry
+            if prefix == "N:":
+                # Save previous monster
+                if current_monster is not None:
+                    finish_monster(current_monster, description_parts)
+                    monsters.append(current_monster)
+
+                parts = line.split(":")
+                monster_id = validate_n_line(parts, line, lineno, result) if validate else None
+                if monster_id is not None:
+                    # Check for duplicates
+                    if monster_id in ids_seen:
+                        result.error(
+                            f"Line {lineno}: Duplicate ID {monster_id} " +
+                            f"(first seen at line {ids_seen[monster_id]})"
+                        )
+                    else:
+                        ids_seen[monster_id] = lineno
+
+                    # Check IDs are increasing
+                    if monster_id <= prev_id:
+                        result.error(
+                            f"Line {lineno}: ID {monster_id} is not greater than previous ID {prev_id} " +
+                            "(IDs must be strictly increasing)"
+                        )
+                    prev_id = monster_id
+
+                    # Check ID against limit
+                    if limits and monster_id > limits.max_monster_id:
+                        result.error(
+                            f"Line {lineno}: Monster ID {monster_id} exceeds maximum allowed ID " +
+                            f"{limits.max_monster_id} (from limits.txt M:R:{limits.max_monster_races})"
+                        )
+
+                # The record is still exported when the line has extra fields
+                if build_records and len(parts) >= 3 and parts[1].isdecimal():
+                    current_monster = Monster(id=int(parts[1]), name=parts[2])
+                    description_parts = []
+
+                in_monster = True
+                first_s_in_monster = True
+                continue
 
-                # Check ID against limit
-                if limits and monster_id > limits.max_monster_id:
+            # Other line types
+            handler = line_handlers.get(prefix)
+            if handler is not None:
+                validate_line, parse_line = handler
+                # Only lines with fields are split, once for both handlers
+                parts = line.split(":")
+                if validate:
+                    validate_line(parts, line, lineno, result)
+                if current_monster is not None:
+                    parse_line(parts, current_monster)
+            elif prefix == "S:":
+                if validate and in_monster and first_s_in_monster:
+                    validate_s_line_is_first(line, lineno, result)
+                    first_s_in_monster = False
+                if current_monster is not None:
+                    parse_s_line(line, current_monster)
+            elif prefix == "F:":
+                # F: lines are free-form flags, no strict validation needed
+                if current_monster is not None:
+                    parse_f_line(line, current_monster)
+            elif prefix == "D:":
+                # D: lines are descriptions, no strict validation needed
+                if current_monster is not None:
+                    description_parts.append(line[2:].strip())
+            elif validate:
+                # Check for unknown line types (letter followed by colon)
+                if len(line) >= 2 and line[1] == ":":
+                    result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
+                else:
                     result.error(
-                        f"Line {lineno}: Monster ID {monster_id} exceeds maximum allowed ID " +
-                        f"{limits.max_monster_id} (from limits.txt M:R:{limits.max_monster_races})"
+                        f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
                     )
 
-            in_monster = True
-            first_s_in_monster = True
-            # current monster name
-            _ = line.split(":")[2] if len(line.split(":")) >= 3 else "unknown"
-            continue
-
-        # Other line types
-        if line.startswith("W:"):
-            validate_w_line(line, lineno, result)
-        elif line.startswith("G:"):
-            validate_g_line(line, lineno, result)
-        elif line.startswith("I:"):
-            validate_i_line(line, lineno, result)
-        elif line.startswith("A:"):
-            validate_a_line(line, lineno, result)
-        elif line.startswith("P:"):
-            validate_p_line(line, lineno, result)
-        elif line.startswith("B:"):
-            validate_b_line(line, lineno, result)
-        elif line.startswith("S:"):
-            if in_monster and first_s_in_monster:
-                validate_s_line_is_first(line, lineno, result)
-                first_s_in_monster = False
-        elif line.startswith("F:"):
-            pass  # F: lines are free-form flags, no strict validation needed
-        elif line.startswith("D:"):
-            pass  # D: lines are descriptions, no strict validation needed
-        else:
-            # Check for unknown line types (letter followed by colon)
-            if len(line) >= 2 and line[1] == ":":
-                result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
-            else:
-                result.error(
-                    f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
-                )
+    if current_monster is not None:
+        finish_monster(current_monster, description_parts)
+        monsters.append(current_monster)
 
     # Check for required version stamp
-    if not has_version:
+    if validate and not has_version:
         result.error("Missing required version stamp (V: line)")
 
     # Check total monster count against limit
@@ -613,7 +651,72 @@ def validate_monster_file(filepath: Path, limits: Limits | None = None) -> Valid
                 f"({limits.max_monster_races}) from limits.txt M:R"
             )
 
-    return result
+    return monsters, result
+
+
+class MonsterEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Monster records and their parts directly.
+
+    Each record is converted as the encoder reaches it, omitting unset values
+    and empty lists, so no intermediate list of dicts is built for the export.
+    Flags and spells are already sorted by parse_monster_file().
+    """
+
+    @override
+    def default(self, o: object) -> object:
+        if isinstance(o, Monster):
+            d: dict[str, object] = {"id": o.id}
+            if o.name:
+                d["name"] = o.name
+            for key in MONSTER_SCALAR_FIELDS:
+                value = cast(str | int | None, getattr(o, key))
+                if value is not None and value != "":
+                    d[key] = value
+            # An attack with no fields set (a bare "B:" line) is left out
+            attacks = [
+                a
+                for a in o.attacks
+                if a.method or a.effect or a.attack_bonus is not None or a.damage_dice
+            ]
+            if attacks:
+                d["attacks"] = attacks
+            spell_info = o.spell_info
+            if spell_info is not None and (
+                spell_info.frequency is not None or spell_info.power is not None or spell_info.spells
+            ):
+                d["spell_info"] = spell_info
+            if o.flags:
+                d["flags"] = o.flags
+            if o.description:
+                d["description"] = o.description
+            return d
+        if isinstance(o, Attack):
+            attack: dict[str, object] = {}
+            if o.method:
+                attack["method"] = o.method
+            if o.effect:
+                attack["effect"] = o.effect
+            if o.attack_bonus is not None:
+                attack["attack_bonus"] = o.attack_bonus
+            if o.damage_dice:
+                attack["damage_dice"] = o.damage_dice
+            return attack
+        if isinstance(o, SpellInfo):
+            spells: dict[str, object] = {}
+            if o.frequency is not None:
+                spells["frequency"] = o.frequency
+            if o.power is not None:
+                spells["power"] = o.power
+            if o.spells:
+                spells["spells"] = o.spells
+            return spells
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def export_monsters_to_json(monsters: list[Monster], fp: TextIO) -> None:
+    """Export monsters as JSON to a text file object."""
+    _ = fp.write(json.dumps({"monsters": monsters}, cls=MonsterEncoder, indent=2, ensure_ascii=False))
+    _ = fp.write("\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -626,6 +729,7 @@ Examples:
   %(prog)s --validate lib/edit/monster.txt  # Validate a specific file
   %(prog)s --export-json                    # Export to JSON (stdout)
   %(prog)s --export-json > monsters.json    # Export to JSON file
+  %(prog)s --validate --export-json         # Validate, then export to JSON (stdout)
 """,
     )
     _ = parser.add_argument(
@@ -647,24 +751,33 @@ Examples:
     return parser.parse_args()
 
 
-def run_validation(monster_file: Path, limits_file: Path) -> int:
-    """Run validation on the monster file."""
-    print("=" * 60)
-    print(f"Validating: {monster_file}")
+def run_validation(monster_file: Path, limits_file: Path, export_json: bool = False) -> int:
+    """Run validation on the monster file.
+
+    With export_json, the monsters from the same parse are also exported to
+    JSON on stdout, and the validation report goes to stderr instead.
+    """
+    out = sys.stderr if export_json else sys.stdout
+
+    print("=" * 60, file=out)
+    print(f"Validating: {monster_file}", file=out)
 
     # Parse limits file
     limits = parse_limits_file(limits_file)
     if limits:
-        print(f"Limits: max monster races = {limits.max_monster_races} (max ID = {limits.max_monster_id})")
+        print(
+            f"Limits: max monster races = {limits.max_monster_races} (max ID = {limits.max_monster_id})",
+            file=out,
+        )
     else:
         print(f"WARNING: Could not parse limits from {limits_file}", file=sys.stderr)
 
     # Validate the file
-    result = validate_monster_file(monster_file, limits)
+    monsters, result = parse_monster_file(monster_file, limits, build_records=export_json)
 
     # Print all messages of the validation result
     for msg in result.info:
-        print(f"INFO: {msg}")
+        print(f"INFO: {msg}", file=out)
 
     for msg in result.warnings:
         print(f"WARNING: {msg}", file=sys.stderr)
@@ -673,28 +786,34 @@ def run_validation(monster_file: Path, limits_file: Path) -> int:
         print(f"ERROR: {msg}", file=sys.stderr)
 
     # Summary
-    print("=" * 60)
-    print(f"  Errors:   {len(result.errors)}")
-    print(f"  Warnings: {len(result.warnings)}")
-    print("=" * 60)
+    print("=" * 60, file=out)
+    print(f"  Errors:   {len(result.errors)}", file=out)
+    print(f"  Warnings: {len(result.warnings)}", file=out)
+    print("=" * 60, file=out)
 
     if result.is_valid:
-        print("OK")
+        print("OK", file=out)
     else:
-        print("FAILED")
+        print("FAILED", file=out)
+
+    if export_json:
+        if not monsters:
+            print(f"ERROR: No monsters found in {monster_file}", file=sys.stderr)
+            return 1
+        export_monsters_to_json(monsters, sys.stdout)
 
     return 0 if result.is_valid else 1
 
 
 def run_export_json(monster_file: Path) -> int:
     """Export monsters to JSON on stdout."""
-    monsters = parse_monsters(monster_file)
+    monsters, _ = parse_monster_file(monster_file, validate=False)
 
     if not monsters:
         print(f"ERROR: No monsters found in {monster_file}", file=sys.stderr)
         return 1
 
-    print(export_monsters_to_json(monsters))
+    export_monsters_to_json(monsters, sys.stdout)
     return 0
 
 
@@ -716,7 +835,8 @@ def main() -> int:
     export_json = cast(bool, args.export_json)
 
     if validate:
-        return run_validation(monster_file, limits_file)
+        # Both flags share one parse: report on stderr, JSON on stdout
+        return run_validation(monster_file, limits_file, export_json=export_json)
 
     if export_json:
         return run_export_json(monster_file)
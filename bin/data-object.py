@@ -32,20 +32,22 @@ import json
 import re
 import signal
 import sys
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import TextIO, cast, override
 
-# JSON-compatible types
-type JsonValue = str | int | float | bool | None | list[JsonValue] | dict[str, JsonValue]
-type JsonDict = dict[str, JsonValue]
+# Per-line-type handlers, see parse_object_file()
+type LineValidator = Callable[[list[str], str, int, ValidationResult], None]
+type LineParser = Callable[[list[str], ObjectKind], None]
 
 # Handle broken pipe (e.g., when piping to head) - Unix only
 if hasattr(signal, "SIGPIPE"):
     _ = signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
@@ -73,21 +75,46 @@ class ValidationResult:
 #
 # Note: The actual file also uses extended colors with numeric suffixes
 # (e.g., s1, U1, D1) which are not documented in the comment section.
-DOCUMENTED_COLORS = {"D", "w", "s", "o", "r", "g", "b", "u", "d", "W", "v", "y", "R", "G", "B", "U"}
-EXTENDED_COLORS = {"D1", "g1", "s1", "U1", "v1", "W1", "y1"}
+DOCUMENTED_COLORS = frozenset(
+    {"D", "w", "s", "o", "r", "g", "b", "u", "d", "W", "v", "y", "R", "G", "B", "U"}
+)
+EXTENDED_COLORS = frozenset({"D1", "g1", "s1", "U1", "v1", "W1", "y1"})
 VALID_COLORS = DOCUMENTED_COLORS | EXTENDED_COLORS
 
 ###
 ### Regex patterns for validation
 ###
-DICE_PATTERN = re.compile(r"^\d+d\d+$")
-# Allocation format: depth/rarity pairs
-ALLOCATION_PATTERN = re.compile(r"^\d+/\d+$")
-# Ability format: skill_id/ability_id
-ABILITY_PATTERN = re.compile(r"^\d+/\d+$")
+# M:K: and M:B: lines of limits.txt
+LIMITS_PATTERN = re.compile(r"^\s*M:([KB]):(\d+)(?::.*)?\s*$", re.MULTILINE)
 
 
-@dataclass
+# Numeric field checks. These short tokens are checked with str methods
+# rather than regexes; isdecimal() accepts exactly what the regex \d does.
+def is_integer(value: str) -> bool:
+    """Check for an integer with an optional leading minus sign (e.g. pval)."""
+    return value[1:].isdecimal() if value[:1] == "-" else value.isdecimal()
+
+
+def is_signed_integer(value: str) -> bool:
+    """Check for an integer with an optional leading '+' or '-' sign."""
+    return value[1:].isdecimal() if value[:1] in ("+", "-") else value.isdecimal()
+
+
+def is_dice(value: str) -> bool:
+    """Check for dice format (NdM)."""
+    count, sep, sides = value.partition("d")
+    return bool(sep) and count.isdecimal() and sides.isdecimal()
+
+
+def parse_pair(value: str) -> tuple[int, int] | None:
+    """Parse an "N/M" pair (depth/rarity or skill_id/ability_id), or return None."""
+    first, sep, second = value.partition("/")
+    if sep and first.isdecimal() and second.isdecimal():
+        return int(first), int(second)
+    return None
+
+
+@dataclass(slots=True)
 class Limits:
     """Limits parsed from lib/edit/limits.txt."""
 
@@ -105,7 +132,7 @@ class Limits:
         return self.max_abilities - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Allocation:
     """An allocation entry (depth/rarity pair)."""
 
@@ -113,7 +140,7 @@ class Allocation:
     rarity: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityRef:
     """An ability reference (B: line)."""
 
@@ -121,7 +148,7 @@ class AbilityRef:
     ability_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectKind:
     """An object record parsed from object.txt."""
 
@@ -146,6 +173,24 @@ class ObjectKind:
     description: str | None = None
 
 
+# Optional scalar fields of an ObjectKind, in JSON export order
+OBJECT_SCALAR_FIELDS = (
+    "symbol",
+    "color",
+    "tval",
+    "sval",
+    "pval",
+    "depth",
+    "rarity",
+    "weight",
+    "cost",
+    "attack_bonus",
+    "damage_dice",
+    "evasion_bonus",
+    "protection_dice",
+)
+
+
 def parse_limits_file(filepath: Path) -> Limits | None:
     """Parse limits.txt and extract relevant limits.
 
@@ -154,21 +199,13 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     if not filepath.exists():
         return None
 
-    max_object_kinds = None
-    max_abilities = None
-
-    for line in filepath.read_text(encoding="latin-1").splitlines():
-        line = line.strip()
-        if line.startswith("M:K:"):
-            # M:K:600 - Maximum number of object kinds
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_object_kinds = int(parts[2])
-        elif line.startswith("M:B:"):
-            # M:B:240 - Maximum number of abilities
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_abilities = int(parts[2])
+    # M:K:600 - Maximum number of object kinds
+    # M:B:240 - Maximum number of abilities
+    # A single regex scan over the whole file; later lines override earlier ones.
+    text = filepath.read_text(encoding="latin-1")
+    values = {match[1]: int(match[2]) for match in LIMITS_PATTERN.finditer(text)}
+    max_object_kinds = values.get("K")
+    max_abilities = values.get("B")
 
     if max_object_kinds is None or max_abilities is None:
         return None
@@ -176,9 +213,8 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     return Limits(max_object_kinds=max_object_kinds, max_abilities=max_abilities)
 
 
-def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | None:
+def validate_n_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> int | None:
     """Validate N: line format and return the ID."""
-    parts = line.split(":")
     if len(parts) < 3:
         result.error(f"Line {lineno}: N: line has {len(parts)} fields, expected at least 3: {line}")
         return None
@@ -191,9 +227,8 @@ def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | N
     return int(id_str)
 
 
-def validate_g_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_g_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate G: line format (symbol : color)."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: G: line has {len(parts)} fields, expected 3: {line}")
         return
@@ -206,9 +241,8 @@ def validate_g_line(line: str, lineno: int, result: ValidationResult) -> None:
         result.warning(f"Line {lineno}: G: color '{color}' not in documented color list")
 
 
-def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_i_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate I: line format (tval : sval : pval)."""
-    parts = line.split(":")
     if len(parts) != 4:
         result.error(f"Line {lineno}: I: line has {len(parts)} fields, expected 4: {line}")
         return
@@ -222,13 +256,12 @@ def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
         result.error(f"Line {lineno}: I: sval is not numeric: {sval}")
 
     # pval can be signed
-    if not re.match(r"^-?\d+$", pval):
+    if not is_integer(pval):
         result.error(f"Line {lineno}: I: pval is not a valid integer: {pval}")
 
 
-def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_w_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate W: line format (depth : rarity : weight : cost)."""
-    parts = line.split(":")
     if len(parts) != 5:
         result.error(f"Line {lineno}: W: line has {len(parts)} fields, expected 5: {line}")
         return
@@ -245,12 +278,11 @@ def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
         result.error(f"Line {lineno}: W: cost is not numeric: {cost}")
 
 
-def validate_p_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_p_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate P: line format (attack_bonus : damage : evasion_bonus : protection).
 
     Note: Some entries have 5 fields instead of 4 (extra trailing field).
     """
-    parts = line.split(":")
     # Allow 5 or 6 fields (P: + 4 or 5 values)
     if len(parts) < 5 or len(parts) > 6:
         result.error(f"Line {lineno}: P: line has {len(parts)} fields, expected 5-6: {line}")
@@ -259,51 +291,51 @@ def validate_p_line(line: str, lineno: int, result: ValidationResult) -> None:
     attack_bonus, damage, evasion_bonus, protection = parts[1], parts[2], parts[3], parts[4]
 
     # attack_bonus can be signed
-    if not re.match(r"^[+-]?\d+$", attack_bonus):
+    if not is_signed_integer(attack_bonus):
         result.error(f"Line {lineno}: P: attack_bonus is not a valid integer: {attack_bonus}")
 
     # damage should be dice format (NdM)
-    if not DICE_PATTERN.match(damage):
+    if not is_dice(damage):
         result.error(f"Line {lineno}: P: damage is not valid dice format (NdM): {damage}")
 
     # evasion_bonus can be signed
-    if not re.match(r"^[+-]?\d+$", evasion_bonus):
+    if not is_signed_integer(evasion_bonus):
         result.error(f"Line {lineno}: P: evasion_bonus is not a valid integer: {evasion_bonus}")
 
     # protection should be dice format
-    if not DICE_PATTERN.match(protection):
+    if not is_dice(protection):
         result.error(f"Line {lineno}: P: protection is not valid dice format (NdM): {protection}")
 
 
-def validate_a_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_a_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate A: line format (depth/rarity pairs)."""
-    parts = line.split(":")
     if len(parts) < 2:
         result.error(f"Line {lineno}: A: line has no allocation data: {line}")
         return
 
     # Each part after A: should be depth/rarity
     for part in parts[1:]:
-        if not ALLOCATION_PATTERN.match(part):
+        if parse_pair(part) is None:
             result.error(f"Line {lineno}: A: invalid allocation format '{part}', expected depth/rarity")
 
 
-def validate_b_line(line: str, lineno: int, result: ValidationResult, limits: Limits | None) -> None:
+def validate_b_line(
+    parts: list[str], line: str, lineno: int, result: ValidationResult, limits: Limits | None
+) -> None:
     """Validate B: line format (ability references)."""
-    parts = line.split(":")
     if len(parts) != 2:
         result.error(f"Line {lineno}: B: line has {len(parts)} fields, expected 2: {line}")
         return
 
     ability_str = parts[1]
-    if not ABILITY_PATTERN.match(ability_str):
+    pair = parse_pair(ability_str)
+    if pair is None:
         result.error(f"Line {lineno}: B: invalid ability format '{ability_str}', expected X/Y")
         return
 
     # Validate ability IDs are within limits
     if limits:
-        # skill_id, ability_id
-        _, ability_id = map(int, ability_str.split("/"))
+        ability_id = pair[1]
         # We can't fully validate skill_id range without knowing all skills
         # but we can check ability_id
         if ability_id > limits.max_ability_id:
@@ -314,236 +346,241 @@ def validate_b_line(line: str, lineno: int, result: ValidationResult, limits: Li
 
 def parse_allocation(alloc_str: str) -> Allocation | None:
     """Parse an allocation string like "5/3" into an Allocation object."""
-    if ALLOCATION_PATTERN.match(alloc_str):
-        depth, rarity = map(int, alloc_str.split("/"))
-        return Allocation(depth=depth, rarity=rarity)
+    pair = parse_pair(alloc_str)
+    if pair:
+        return Allocation(depth=pair[0], rarity=pair[1])
     return None
 
 
 def parse_ability(ability_str: str) -> AbilityRef | None:
     """Parse an ability string like "4/2" into an AbilityRef object."""
-    if ABILITY_PATTERN.match(ability_str):
-        skill_id, ability_id = map(int, ability_str.split("/"))
-        return AbilityRef(skill_id=skill_id, ability_id=ability_id)
+    pair = parse_pair(ability_str)
+    if pair:
+        return AbilityRef(skill_id=pair[0], ability_id=pair[1])
     return None
 
 
-def parse_p_line(parts: list[str]) -> tuple[int | None, str | None, int | None, str | None]:
+def parse_int(value: str) -> int | None:
+    """Convert a field with a single int() call, returning None if it is not an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def parse_p_values(parts: list[str]) -> tuple[int | None, str | None, int | None, str | None]:
     """Parse P: line values and return attack_bonus, damage, evasion_bonus, protection."""
     if len(parts) < 5:
         return None, None, None, None
 
-    attack_bonus = None
+    attack_bonus = parse_int(parts[1])
     damage_dice = None
-    evasion_bonus = None
+    evasion_bonus = parse_int(parts[3])
     protection_dice = None
 
-    if re.match(r"^[+-]?\d+$", parts[1]):
-        attack_bonus = int(parts[1])
-    if DICE_PATTERN.match(parts[2]):
+    if is_dice(parts[2]):
         damage_dice = parts[2]
-    if re.match(r"^[+-]?\d+$", parts[3]):
-        evasion_bonus = int(parts[3])
-    if DICE_PATTERN.match(parts[4]):
+    if is_dice(parts[4]):
         protection_dice = parts[4]
 
     return attack_bonus, damage_dice, evasion_bonus, protection_dice
 
 
-def parse_objects(filepath: Path) -> list[ObjectKind]:
-    """Parse object.txt and return a list of ObjectKind objects."""
-    if not filepath.exists():
-        return []
+def parse_g_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse G: line (symbol : color) into obj."""
+    if len(parts) >= 3:
+        # Symbols and colors come from a small set, so share one string each
+        obj.symbol = sys.intern(parts[1])
+        obj.color = sys.intern(parts[2])
+
+
+def parse_i_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse I: line (tval : sval : pval) into obj."""
+    if len(parts) >= 4:
+        if (tval := parse_int(parts[1])) is not None:
+            obj.tval = tval
+        if (sval := parse_int(parts[2])) is not None:
+            obj.sval = sval
+        if (pval := parse_int(parts[3])) is not None:
+            obj.pval = pval
+
+
+def parse_w_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse W: line (depth : rarity : weight : cost) into obj."""
+    if len(parts) >= 5:
+        if (depth := parse_int(parts[1])) is not None:
+            obj.depth = depth
+        if (rarity := parse_int(parts[2])) is not None:
+            obj.rarity = rarity
+        if (weight := parse_int(parts[3])) is not None:
+            obj.weight = weight
+        if (cost := parse_int(parts[4])) is not None:
+            obj.cost = cost
+
+
+def parse_p_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse P: line (attack_bonus : damage : evasion_bonus : protection) into obj."""
+    attack, damage, evasion, protection = parse_p_values(parts)
+    obj.attack_bonus = attack
+    obj.damage_dice = damage
+    obj.evasion_bonus = evasion
+    obj.protection_dice = protection
+
+
+def parse_a_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse A: line (depth/rarity pairs) into obj."""
+    for part in parts[1:]:
+        alloc = parse_allocation(part)
+        if alloc:
+            obj.allocations.append(alloc)
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
-    objects: list[ObjectKind] = []
-    current_object: ObjectKind | None = None
 
-    for line in lines:
-        line = line.strip()
+def parse_b_line(parts: list[str], obj: ObjectKind) -> None:
+    """Parse B: line (ability reference) into obj."""
+    if len(parts) >= 2:
+        ability = parse_ability(parts[1])
+        if ability:
+            obj.abilities.append(ability)
 
-        # Skip empty lines and comments
-        if not line or line.startswith("#") or line.startswith("V:"):
-            continue
 
-        # N: line - start of new object
-        if line.startswith("N:"):
-            # Save previous object
-            if current_object is not None:
-                objects.append(current_object)
+def parse_f_line(line: str, obj: ObjectKind) -> None:
+    """Parse F: line (flag | flag | etc) into obj."""
+    content = line[2:]  # Remove "F:"
+    # Flags come from a fixed vocabulary, so share one string per flag name
+    flags = [sys.intern(flag) for f in content.split("|") if (flag := f.strip())]
+    obj.flags.extend(flags)
 
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[1].isdigit():
-                # Join remaining parts for name (in case name contains colons)
-                name = ":".join(parts[2:])
-                current_object = ObjectKind(id=int(parts[1]), name=name)
-            continue
 
-        if current_object is None:
-            continue
+def finish_object(obj: ObjectKind, description_parts: list[str]) -> None:
+    """Finalize an object record once all of its lines have been read.
 
-        # G: symbol : color
-        if line.startswith("G:"):
-            parts = line.split(":")
-            if len(parts) >= 3:
-                current_object.symbol = parts[1]
-                current_object.color = parts[2]
+    Joins the collected D: fragments into the description, and sorts and
+    deduplicates the flags gathered from all F: lines.
+    """
+    if description_parts:
+        obj.description = " ".join(description_parts)
+    if obj.flags:
+        obj.flags = sorted(set(obj.flags))
 
-        # I: tval : sval : pval
-        elif line.startswith("I:"):
-            parts = line.split(":")
-            if len(parts) >= 4:
-                if parts[1].isdigit():
-                    current_object.tval = int(parts[1])
-                if parts[2].isdigit():
-                    current_object.sval = int(parts[2])
-                if re.match(r"^-?\d+$", parts[3]):
-                    current_object.pval = int(parts[3])
-
-        # W: depth : rarity : weight : cost
-        elif line.startswith("W:"):
-            parts = line.split(":")
-            if len(parts) >= 5:
-                if parts[1].isdigit():
-                    current_object.depth = int(parts[1])
-                if parts[2].isdigit():
-                    current_object.rarity = int(parts[2])
-                if parts[3].isdigit():
-                    current_object.weight = int(parts[3])
-                if parts[4].isdigit():
-                    current_object.cost = int(parts[4])
-
-        # P: attack_bonus : damage : evasion_bonus : protection
-        elif line.startswith("P:"):
-            parts = line.split(":")
-            attack, damage, evasion, protection = parse_p_line(parts)
-            current_object.attack_bonus = attack
-            current_object.damage_dice = damage
-            current_object.evasion_bonus = evasion
-            current_object.protection_dice = protection
-
-        # A: allocation pairs
-        elif line.startswith("A:"):
-            parts = line.split(":")
-            for part in parts[1:]:
-                alloc = parse_allocation(part)
-                if alloc:
-                    current_object.allocations.append(alloc)
 
-        # B: ability reference
-        elif line.startswith("B:"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                ability = parse_ability(parts[1])
-                if ability:
-                    current_object.abilities.append(ability)
-
-        # F: flags
-        elif line.startswith("F:"):
-            content = line[2:]  # Remove "F:"
-            flags = [f.strip() for f in content.split("|") if f.strip()]
-            current_object.flags.extend(flags)
-
-        # D: description
-        elif line.startswith("D:"):
-            content = line[2:].strip()  # Remove "D:" and strip whitespace
-            if current_object.description is None:
-                current_object.description = content
-            else:
-                current_object.description += " " + content
+def read_records(filepath: Path) -> list[tuple[int, str]] | None:
+    """Read the data lines of a latin-1 encoded file with their line numbers.
 
-    if current_object is not None:
-        objects.append(current_object)
+    Blank lines and comments are dropped while the lines are still bytes, so
+    only data lines are decoded. As in the game, a line ends only at a newline.
+    Carriage returns anywhere in it (the game skips control characters) and
+    trailing whitespace are dropped, but leading whitespace is kept: records
+    start in column 0, and the game rejects indented lines.
 
-    return objects
-
-
-def export_objects_to_json(objects: list[ObjectKind]) -> str:
-    """Export objects to a JSON string."""
-
-    def clean_dict(d: JsonDict) -> JsonDict:
-        """Recursively remove None values and empty collections from a dict."""
-        result: JsonDict = {}
-        for k, v in d.items():
-            if v is None or v == [] or v == "":
-                continue
-            if isinstance(v, dict):
-                cleaned = clean_dict(v)
-                if cleaned:  # Only include non-empty dicts
-                    result[k] = cleaned
-            elif isinstance(v, list):
-                # Clean each item if it's a dict
-                cleaned_list: list[JsonValue] = []
-                for item in v:
-                    if isinstance(item, dict):
-                        cleaned_item = clean_dict(item)
-                        if cleaned_item:
-                            cleaned_list.append(cleaned_item)
-                    elif item is not None:
-                        cleaned_list.append(item)
-                if cleaned_list:
-                    result[k] = cleaned_list
-            else:
-                result[k] = v
-        return result
+    Returns None if the file does not exist.
+    """
+    if not filepath.exists():
+        return None
 
-    def object_to_dict(obj: ObjectKind) -> JsonDict:
-        """Convert an ObjectKind to a dict, removing None values."""
-        d = clean_dict(asdict(obj))
-        if "flags" in d and isinstance(d["flags"], list):
-            d["flags"] = cast(JsonValue, sorted(cast(list[str], d["flags"])))
-        return d
+    return [
+        (lineno, line.decode("latin-1"))
+        for lineno, raw_line in enumerate(filepath.read_bytes().split(b"\n"), start=1)
+        if (line := raw_line.replace(b"\r", b"").rstrip()) and line[:1] != b"#"
+    ]
 
-    data = {"objects": [object_to_dict(o) for o in objects]}
-    return json.dumps(data, indent=2, ensure_ascii=False)
 
+def parse_object_file(
+    filepath: Path,
+    limits: Limits | None = None,
+    *,
+    validate: bool = True,
+    build_records: bool = True,
+) -> tuple[list[ObjectKind], ValidationResult]:
+    """Parse and/or validate the entire object.txt file in a single pass.
 
-def validate_object_file(filepath: Path, limits: Limits | None = None) -> ValidationResult:
-    """Validate the entire object.txt file.
+    Each data line is split once, then validated and applied to the current
+    object record. Only the work for the requested modes is done.
 
     Args:
         filepath: Path to object.txt file.
         limits: Optional limits from limits.txt. If provided, validates
                 object count and IDs against the maximum allowed.
+        validate: Whether to check the file format and integrity.
+        build_records: Whether to build the object records.
+
+    Returns:
+        The parsed object records (empty unless build_records is set) and
+        the validation result (without checks unless validate is set).
     """
     result = ValidationResult()
+    objects: list[ObjectKind] = []
 
-    if not filepath.exists():
+    records = read_records(filepath)
+    if records is None:
         result.error(f"Object file not found: {filepath}")
-        return result
+        return objects, result
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
+    current_object: ObjectKind | None = None
+    # D: fragments of the current object, joined once the object is complete
+    description_parts: list[str] = []
 
-    # Track state. Maps id -> line number.
-    ids_seen: dict[int, int] = {}
+    # Track state. Maps id -> line number of its first N: line (0 = unseen).
+    # IDs are dense and bounded by limits.txt, so those are tracked in a flat
+    # list indexed by ID; IDs beyond the limit (already an error) use a dict.
+    first_lines = [0] * limits.max_object_kinds if limits else []
+    first_lines_overflow: dict[int, int] = {}
+    object_count = 0
 
     prev_id = -1
     has_version = False
 
-    for lineno, line in enumerate(lines, start=1):
-        line = line.strip()
+    # Validator and record parser for each line type, keyed by line prefix.
+    # V:, N:, F: and D: lines are handled inline.
+    line_handlers: dict[str, tuple[LineValidator, LineParser]] = {
+        "G:": (validate_g_line, parse_g_line),
+        "I:": (validate_i_line, parse_i_line),
+        "W:": (validate_w_line, parse_w_line),
+        "P:": (validate_p_line, parse_p_line),
+        "A:": (validate_a_line, parse_a_line),
+        "B:": (partial(validate_b_line, limits=limits), parse_b_line),
+    }
 
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
+    for lineno, line in records:
+        prefix = line[:2]
 
         # Version stamp
-        if line.startswith("V:"):
+        if prefix == "V:":
             has_version = True
             continue
 
         # N: line - start of object entry
-        if line.startswith("N:"):
-            object_id = validate_n_line(line, lineno, result)
-            if object_id is not None:
+        if prefix == "N:":
+            # Save previous object
+            if current_object is not None:
+                finish_object(current_object, description_parts)
+                objects.append(current_object)
+
+            parts = line.split(":")
+            if validate:
+                object_id = validate_n_line(parts, line, lineno, result)
+            elif len(parts) >= 3 and parts[1].isdigit():
+                # The fields validate_n_line() requires, without reporting
+                object_id = int(parts[1])
+            else:
+                object_id = None
+
+            if validate and object_id is not None:
                 # Check for duplicates
-                if object_id in ids_seen:
+                if object_id < len(first_lines):
+                    first_line = first_lines[object_id]
+                    if not first_line:
+                        first_lines[object_id] = lineno
+                else:
+                    first_line = first_lines_overflow.setdefault(object_id, 0)
+                    if not first_line:
+                        first_lines_overflow[object_id] = lineno
+                if first_line:
                     result.error(
                         f"Line {lineno}: Duplicate ID {object_id} " +
-                        f"(first seen at line {ids_seen[object_id]})"
+                        f"(first seen at line {first_line})"
                     )
                 else:
-                    ids_seen[object_id] = lineno
+                    object_count += 1
 
                 # Check IDs are increasing
                 if object_id <= prev_id:
@@ -559,26 +596,32 @@ def validate_object_file(filepath: Path, limits: Limits | None = None) -> Valida
                         f"Line {lineno}: Object ID {object_id} exceeds maximum allowed ID " +
                         f"{limits.max_object_id} (from limits.txt M:K:{limits.max_object_kinds})"
                     )
+
+            if build_records and object_id is not None:
+                # Join remaining parts for name (in case name contains colons)
+                current_object = ObjectKind(id=object_id, name=":".join(parts[2:]))
+                description_parts = []
             continue
 
         # Other line types
-        if line.startswith("G:"):
-            validate_g_line(line, lineno, result)
-        elif line.startswith("I:"):
-            validate_i_line(line, lineno, result)
-        elif line.startswith("W:"):
-            validate_w_line(line, lineno, result)
-        elif line.startswith("P:"):
-            validate_p_line(line, lineno, result)
-        elif line.startswith("A:"):
-            validate_a_line(line, lineno, result)
-        elif line.startswith("B:"):
-            validate_b_line(line, lineno, result, limits)
-        elif line.startswith("F:"):
-            pass  # F: lines are free-form flags, no strict validation needed
-        elif line.startswith("D:"):
-            pass  # D: lines are descriptions, no strict validation needed
-        else:
+        handler = line_handlers.get(prefix)
+        if handler is not None:
+            validate_line, parse_line = handler
+            parts = line.split(":")
+            if validate:
+                validate_line(parts, line, lineno, result)
+            if current_object is not None:
+                parse_line(parts, current_object)
+        elif prefix == "F:":
+            # F: lines are free-form flags, no strict validation needed
+            if current_object is not None:
+                parse_f_line(line, current_object)
+        elif prefix == "D:":
+            # D: lines are descriptions, no strict validation needed
+            if current_object is not None:
+                # The line is already stripped, so only the space after "D:" remains
+                description_parts.append(line[2:].lstrip())
+        elif validate:
             # Check for unknown line types (letter followed by colon)
             if len(line) >= 2 and line[1] == ":":
                 result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
@@ -587,20 +630,62 @@ def validate_object_file(filepath: Path, limits: Limits | None = None) -> Valida
                     f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
                 )
 
+    if current_object is not None:
+        finish_object(current_object, description_parts)
+        objects.append(current_object)
+
     # Check for required version stamp
-    if not has_version:
+    if validate and not has_version:
         result.error("Missing required version stamp (V: line)")
 
     # Check total object count against limit
     if limits:
-        object_count = len(ids_seen)
         if object_count > limits.max_object_kinds:
             result.error(
                 f"Total object count ({object_count}) exceeds maximum allowed " +
                 f"({limits.max_object_kinds}) from limits.txt M:K"
             )
 
-    return result
+    return objects, result
+
+
+class ObjectEncoder(json.JSONEncoder):
+    """JSON encoder that serializes ObjectKind records and their parts directly.
+
+    Each record is converted as the encoder reaches it, omitting unset values
+    and empty lists, so no intermediate list of dicts is built for the export.
+    """
+
+    @override
+    def default(self, o: object) -> object:
+        if isinstance(o, ObjectKind):
+            d: dict[str, object] = {"id": o.id}
+            if o.name:
+                d["name"] = o.name
+            for key in OBJECT_SCALAR_FIELDS:
+                value = cast(str | int | None, getattr(o, key))
+                if value is not None and value != "":
+                    d[key] = value
+            if o.allocations:
+                d["allocations"] = o.allocations
+            if o.abilities:
+                d["abilities"] = o.abilities
+            if o.flags:
+                d["flags"] = o.flags
+            if o.description:
+                d["description"] = o.description
+            return d
+        if isinstance(o, Allocation):
+            return {"depth": o.depth, "rarity": o.rarity}
+        if isinstance(o, AbilityRef):
+            return {"skill_id": o.skill_id, "ability_id": o.ability_id}
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def export_objects_to_json(objects: list[ObjectKind], fp: TextIO) -> None:
+    """Export objects as JSON to a text file object."""
+    _ = fp.write(json.dumps({"objects": objects}, cls=ObjectEncoder, indent=2, ensure_ascii=False))
+    _ = fp.write("\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -613,6 +698,7 @@ Examples:
   %(prog)s --validate lib/edit/object.txt  # Validate a specific file
   %(prog)s --export-json                   # Export to JSON (stdout)
   %(prog)s --export-json > objects.json    # Export to JSON file
+  %(prog)s --validate --export-json        # Validate, then export to JSON (stdout)
 """,
     )
     _ = parser.add_argument(
@@ -634,24 +720,33 @@ Examples:
     return parser.parse_args()
 
 
-def run_validation(object_file: Path, limits_file: Path) -> int:
-    """Run validation on the object file."""
-    print("=" * 60)
-    print(f"Validating: {object_file}")
+def run_validation(object_file: Path, limits_file: Path, export_json: bool = False) -> int:
+    """Run validation on the object file.
+
+    With export_json, the objects from the same parse are also exported to JSON
+    on stdout, and the validation report goes to stderr instead.
+    """
+    out = sys.stderr if export_json else sys.stdout
+
+    print("=" * 60, file=out)
+    print(f"Validating: {object_file}", file=out)
 
     # Parse limits file
     limits = parse_limits_file(limits_file)
     if limits:
-        print(f"Limits: max object kinds = {limits.max_object_kinds} (max ID = {limits.max_object_id})")
+        print(
+            f"Limits: max object kinds = {limits.max_object_kinds} (max ID = {limits.max_object_id})",
+            file=out,
+        )
     else:
         print(f"WARNING: Could not parse limits from {limits_file}", file=sys.stderr)
 
     # Validate the file
-    result = validate_object_file(object_file, limits)
+    objects, result = parse_object_file(object_file, limits, build_records=export_json)
 
     # Print all messages of the validation result
     for msg in result.info:
-        print(f"INFO: {msg}")
+        print(f"INFO: {msg}", file=out)
 
     for msg in result.warnings:
         print(f"WARNING: {msg}", file=sys.stderr)
@@ -660,28 +755,34 @@ def run_validation(object_file: Path, limits_file: Path) -> int:
         print(f"ERROR: {msg}", file=sys.stderr)
 
     # Summary
-    print("=" * 60)
-    print(f"  Errors:   {len(result.errors)}")
-    print(f"  Warnings: {len(result.warnings)}")
-    print("=" * 60)
+    print("=" * 60, file=out)
+    print(f"  Errors:   {len(result.errors)}", file=out)
+    print(f"  Warnings: {len(result.warnings)}", file=out)
+    print("=" * 60, file=out)
 
     if result.is_valid:
-        print("OK")
+        print("OK", file=out)
     else:
-        print("FAILED")
+        print("FAILED", file=out)
+
+    if export_json:
+        if not objects:
+            print(f"ERROR: No objects found in {object_file}", file=sys.stderr)
+            return 1
+        export_objects_to_json(objects, sys.stdout)
 
     return 0 if result.is_valid else 1
 
 
 def run_export_json(object_file: Path) -> int:
     """Export objects to JSON on stdout."""
-    objects = parse_objects(object_file)
+    objects, _ = parse_object_file(object_file, validate=False)
 
     if not objects:
         print(f"ERROR: No objects found in {object_file}", file=sys.stderr)
         return 1
 
-    print(export_objects_to_json(objects))
+    export_objects_to_json(objects, sys.stdout)
     return 0
 
 
@@ -703,7 +804,8 @@ def main() -> int:
     export_json = cast(bool, args.export_json)
 
     if validate:
-        return run_validation(object_file, limits_file)
+        # Both flags share one parse: report on stderr, JSON on stdout
+        return run_validation(object_file, limits_file, export_json=export_json)
 
     if export_json:
         return run_export_json(object_file)
@@ -29,23 +29,27 @@ Exit codes:
 
 import argparse
 import json
+import mmap
+import os
 import re
 import signal
+import stat
 import sys
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, TextIO, cast, override
 
-# JSON-compatible types
-type JsonValue = str | int | float | bool | None | list[JsonValue] | dict[str, JsonValue]
-type JsonDict = dict[str, JsonValue]
+# Per-line-type handlers, see parse_race_file()
+type LineValidator = Callable[[list[str], str, int, ValidationResult], None]
+type LineParser = Callable[[list[str], Race], None]
 
 # Handle broken pipe (e.g., when piping to head) - Unix only
 if hasattr(signal, "SIGPIPE"):
     _ = signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
@@ -65,7 +69,14 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
-@dataclass
+###
+### Regex patterns for validation
+###
+# M:P: line of limits.txt
+LIMITS_PATTERN = re.compile(rb"^\s*M:P:(\d+)(?::.*)?\s*$", re.MULTILINE)
+
+
+@dataclass(slots=True)
 class Limits:
     """Limits parsed from lib/edit/limits.txt."""
 
@@ -77,7 +88,7 @@ class Limits:
         return self.max_player_races - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     """Starting equipment entry (E: line)."""
 
@@ -87,7 +98,7 @@ class Equipment:
     max_amount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Race:
     """A race record parsed from race.txt."""
 
@@ -110,23 +121,38 @@ class Race:
     description: str | None = None
 
 
+# Optional integer fields of a Race, in JSON export order
+RACE_INT_FIELDS = (
+    "str_mod",
+    "dex_mod",
+    "con_mod",
+    "gra_mod",
+    "history",
+    "age_base",
+    "age_max",
+    "height_base",
+    "height_mod",
+    "weight_base",
+    "weight_mod",
+)
+
+
 def parse_limits_file(filepath: Path) -> Limits | None:
     """Parse limits.txt and extract relevant limits.
 
     Returns None if the file cannot be parsed.
     """
-    if not filepath.exists():
+    try:
+        data = filepath.read_bytes()
+    except FileNotFoundError:
         return None
 
+    # M:P:4 - Maximum number of player races
+    # A single regex scan over the raw bytes; later lines override earlier ones.
+    # Only the ASCII digits are needed, so the file is never decoded.
     max_player_races = None
-
-    for line in filepath.read_text(encoding="latin-1").splitlines():
-        line = line.strip()
-        if line.startswith("M:P:"):
-            # M:P:4 - Maximum number of player races
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_player_races = int(parts[2])
+    for match in LIMITS_PATTERN.finditer(data):
+        max_player_races = int(match[1])
 
     if max_player_races is None:
         return None
@@ -134,9 +160,35 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     return Limits(max_player_races=max_player_races)
 
 
-def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | None:
+def iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the raw lines of an open file through a read-only memory map.
+
+    The file is never copied into one large buffer; each line is sliced out
+    of the map as it is consumed. A pipe or other non-regular file cannot be
+    mapped and is read line by line. As in the game, a line ends only at a
+    newline. Callers drop carriage returns anywhere in it (the game skips
+    control characters) and trailing whitespace, but keep leading
+    whitespace: records start in column 0, and the game rejects indented
+    lines.
+    """
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode):
+        yield from f
+        return
+    # mmap cannot map an empty file
+    if st.st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def is_integer(value: str) -> bool:
+    """Check for an integer with an optional leading minus sign."""
+    return value[1:].isdecimal() if value[:1] == "-" else value.isdecimal()
+
+
+def validate_n_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> int | None:
     """Validate N: line format and return the ID."""
-    parts = line.split(":")
     if len(parts) < 3:
         result.error(f"Line {lineno}: N: line has {len(parts)} fields, expected at least 3: {line}")
         return None
@@ -149,22 +201,20 @@ def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | N
     return int(id_str)
 
 
-def validate_s_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_s_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate S: line format (str : dex : con : gra)."""
-    parts = line.split(":")
     if len(parts) != 5:
         result.error(f"Line {lineno}: S: line has {len(parts)} fields, expected 5: {line}")
         return
 
     for i, name in enumerate(["str", "dex", "con", "gra"], start=1):
         val = parts[i]
-        if not re.match(r"^-?\d+$", val):
+        if not is_integer(val):
             result.error(f"Line {lineno}: S: {name} is not a valid integer: {val}")
 
 
-def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_i_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate I: line format (history : agebase : agemax)."""
-    parts = line.split(":")
     if len(parts) != 4:
         result.error(f"Line {lineno}: I: line has {len(parts)} fields, expected 4: {line}")
         return
@@ -175,9 +225,8 @@ def validate_i_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: I: {name} is not numeric: {val}")
 
 
-def validate_h_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_h_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate H: line format (hgt : modhgt)."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: H: line has {len(parts)} fields, expected 3: {line}")
         return
@@ -188,9 +237,8 @@ def validate_h_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: H: {name} is not numeric: {val}")
 
 
-def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_w_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate W: line format (wgt : modwgt)."""
-    parts = line.split(":")
     if len(parts) != 3:
         result.error(f"Line {lineno}: W: line has {len(parts)} fields, expected 3: {line}")
         return
@@ -201,9 +249,8 @@ def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: W: {name} is not numeric: {val}")
 
 
-def validate_c_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_c_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate C: line format (pipe-separated house IDs)."""
-    parts = line.split(":")
     if len(parts) != 2:
         result.error(f"Line {lineno}: C: line has {len(parts)} fields, expected 2: {line}")
         return
@@ -215,14 +262,8 @@ def validate_c_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: C: house ID is not numeric: {house}")
 
 
-def validate_e_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_e_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate E: line format (tval : sval : min : max)."""
-    # Remove inline comments
-    if "#" in line:
-        line = line[: line.index("#")]
-    line = line.strip()
-
-    parts = line.split(":")
     if len(parts) != 5:
         result.error(f"Line {lineno}: E: line has {len(parts)} fields, expected 5: {line}")
         return
@@ -233,14 +274,8 @@ def validate_e_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: E: {name} is not numeric: {val}")
 
 
-def parse_equipment(line: str) -> Equipment | None:
-    """Parse an E: line into an Equipment object."""
-    # Remove inline comments
-    if "#" in line:
-        line = line[: line.index("#")]
-    line = line.strip()
-
-    parts = line.split(":")
+def parse_equipment(parts: list[str]) -> Equipment | None:
+    """Parse the fields of an E: line into an Equipment object."""
     if len(parts) != 5:
         return None
 
@@ -255,256 +290,305 @@ def parse_equipment(line: str) -> Equipment | None:
         return None
 
 
-def parse_races(filepath: Path) -> list[Race]:
-    """Parse race.txt and return a list of Race objects."""
-    if not filepath.exists():
-        return []
-
-    lines = filepath.read_text(encoding="latin-1").splitlines()
-    races: list[Race] = []
-    current_race: Race | None = None
-
-    for line in lines:
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#") or line.startswith("V:"):
-            continue
-
-        # N: line - start of new race
-        if line.startswith("N:"):
-            # Save previous race
-            if current_race is not None:
-                races.append(current_race)
-
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[1].isdigit():
-                current_race = Race(id=int(parts[1]), name=parts[2])
-            continue
-
-        if current_race is None:
-            continue
-
-        # S: str : dex : con : gra
-        if line.startswith("S:"):
-            parts = line.split(":")
-            if len(parts) >= 5:
-                if re.match(r"^-?\d+$", parts[1]):
-                    current_race.str_mod = int(parts[1])
-                if re.match(r"^-?\d+$", parts[2]):
-                    current_race.dex_mod = int(parts[2])
-                if re.match(r"^-?\d+$", parts[3]):
-                    current_race.con_mod = int(parts[3])
-                if re.match(r"^-?\d+$", parts[4]):
-                    current_race.gra_mod = int(parts[4])
-
-        # I: history : agebase : agemax
-        elif line.startswith("I:"):
-            parts = line.split(":")
-            if len(parts) >= 4:
-                if parts[1].isdigit():
-                    current_race.history = int(parts[1])
-                if parts[2].isdigit():
-                    current_race.age_base = int(parts[2])
-                if parts[3].isdigit():
-                    current_race.age_max = int(parts[3])
-
-        # H: hgt : modhgt
-        elif line.startswith("H:"):
-            parts = line.split(":")
-            if len(parts) >= 3:
-                if parts[1].isdigit():
-                    current_race.height_base = int(parts[1])
-                if parts[2].isdigit():
-                    current_race.height_mod = int(parts[2])
-
-        # W: wgt : modwgt
-        elif line.startswith("W:"):
-            parts = line.split(":")
-            if len(parts) >= 3:
-                if parts[1].isdigit():
-                    current_race.weight_base = int(parts[1])
-                if parts[2].isdigit():
-                    current_race.weight_mod = int(parts[2])
-
-        # C: house IDs
-        elif line.startswith("C:"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                houses = parts[1].split("|")
-                for house in houses:
-                    if house.isdigit():
-                        current_race.houses.append(int(house))
-
-        # F: flags
-        elif line.startswith("F:"):
-            content = line[2:]  # Remove "F:"
-            flags = [f.strip() for f in content.split("|") if f.strip()]
-            current_race.flags.extend(flags)
-
-        # E: equipment
-        elif line.startswith("E:"):
-            equip = parse_equipment(line)
-            if equip:
-                current_race.equipment.append(equip)
-
-        # D: description
-        elif line.startswith("D:"):
-            content = line[2:].strip()  # Remove "D:" and strip whitespace
-            if current_race.description is None:
-                current_race.description = content
-            else:
-                current_race.description += " " + content
-
-    if current_race is not None:
-        races.append(current_race)
-
-    return races
-
+def parse_int(value: str) -> int | None:
+    """Convert a field with a single int() call, returning None if it is not an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
-def export_races_to_json(races: list[Race]) -> str:
-    """Export races to a JSON string."""
 
-    def clean_dict(d: JsonDict) -> JsonDict:
-        """Recursively remove None values and empty collections from a dict."""
-        result: JsonDict = {}
-        for k, v in d.items():
-            if v is None or v == [] or v == "":
-                continue
-            if isinstance(v, dict):
-                cleaned = clean_dict(v)
-                if cleaned:  # Only include non-empty dicts
-                    result[k] = cleaned
-            elif isinstance(v, list):
-                # Clean each item if it's a dict
-                cleaned_list: list[JsonValue] = []
-                for item in v:
-                    if isinstance(item, dict):
-                        cleaned_item = clean_dict(item)
-                        if cleaned_item:
-                            cleaned_list.append(cleaned_item)
-                    elif item is not None:
-                        cleaned_list.append(item)
-                if cleaned_list:
-                    result[k] = cleaned_list
-            else:
-                result[k] = v
-        return result
-
-    def race_to_dict(race: Race) -> JsonDict:
-        """Convert a Race to a dict, removing None values."""
-        d = clean_dict(asdict(race))
-        if "flags" in d and isinstance(d["flags"], list):
-            d["flags"] = cast(JsonValue, sorted(cast(list[str], d["flags"])))
-        return d
-
-    data = {"races": [race_to_dict(r) for r in races]}
-    return json.dumps(data, indent=2, ensure_ascii=False)
-
-
-def validate_race_file(filepath: Path, limits: Limits | None = None) -> ValidationResult:
-    """Validate the entire race.txt file.
+def parse_s_line(parts: list[str], race: Race) -> None:
+    """Apply S: str : dex : con : gra to a race."""
+    if len(parts) >= 5:
+        if (str_mod := parse_int(parts[1])) is not None:
+            race.str_mod = str_mod
+        if (dex_mod := parse_int(parts[2])) is not None:
+            race.dex_mod = dex_mod
+        if (con_mod := parse_int(parts[3])) is not None:
+            race.con_mod = con_mod
+        if (gra_mod := parse_int(parts[4])) is not None:
+            race.gra_mod = gra_mod
+
+
+def parse_i_line(parts: list[str], race: Race) -> None:
+    """Apply I: history : agebase : agemax to a race."""
+    if len(parts) >= 4:
+        if (history := parse_int(parts[1])) is not None:
+            race.history = history
+        if (age_base := parse_int(parts[2])) is not None:
+            race.age_base = age_base
+        if (age_max := parse_int(parts[3])) is not None:
+            race.age_max = age_max
+
+
+def parse_h_line(parts: list[str], race: Race) -> None:
+    """Apply H: hgt : modhgt to a race."""
+    if len(parts) >= 3:
+        if (height_base := parse_int(parts[1])) is not None:
+            race.height_base = height_base
+        if (height_mod := parse_int(parts[2])) is not None:
+            race.height_mod = height_mod
+
+
+def parse_w_line(parts: list[str], race: Race) -> None:
+    """Apply W: wgt : modwgt to a race."""
+    if len(parts) >= 3:
+        if (weight_base := parse_int(parts[1])) is not None:
+            race.weight_base = weight_base
+        if (weight_mod := parse_int(parts[2])) is not None:
+            race.weight_mod = weight_mod
+
+
+def parse_c_line(parts: list[str], race: Race) -> None:
+    """Apply C: house | house | etc to a race."""
+    if len(parts) >= 2:
+        for house in parts[1].split("|"):
+            if (house_id := parse_int(house)) is not None:
+                race.houses.append(house_id)
+
+
+def parse_f_line(line: str, race: Race) -> None:
+    """Apply F: flag | flag | etc to a race."""
+    content = line[2:]  # Remove "F:"
+    # Flags come from a fixed vocabulary, so share one string per flag name
+    flags = [sys.intern(flag) for f in content.split("|") if (flag := f.strip())]
+    race.flags.extend(flags)
+
+
+def parse_race_file(
+    filepath: Path,
+    limits: Limits | None = None,
+    *,
+    validate: bool = True,
+    build_records: bool = True,
+) -> tuple[list[Race], ValidationResult]:
+    """Parse and/or validate the entire race.txt file in a single pass.
+
+    Each line is read and split once, then validated and applied to the
+    current race record. Only the work for the requested modes is done.
 
     Args:
         filepath: Path to race.txt file.
         limits: Optional limits from limits.txt. If provided, validates
                 race count and IDs against the maximum allowed.
+        validate: Whether to check the file format and integrity.
+        build_records: Whether to build the race records.
+
+    Returns:
+        The parsed race records (empty unless build_records is set) and
+        the validation result (without checks unless validate is set).
     """
     result = ValidationResult()
+    races: list[Race] = []
 
-    if not filepath.exists():
+    # Open once and let a missing file surface here, instead of a separate stat
+    try:
+        f = filepath.open("rb")
+    except FileNotFoundError:
         result.error(f"Race file not found: {filepath}")
-        return result
+        return races, result
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
+    current_race: Race | None = None
+    # D: fragments of the current race, joined once the race is complete
+    description_parts: list[str] = []
 
-    # Track state. Maps id -> line number.
-    ids_seen: dict[int, int] = {}
+    # Track state. Maps id -> line number of its first N: line (0 = unseen).
+    # IDs are dense and bounded by limits.txt, so those are tracked in a flat
+    # list indexed by ID; IDs beyond the limit (already an error) use a dict.
+    first_lines = [0] * limits.max_player_races if limits else []
+    first_lines_overflow: dict[int, int] = {}
+    race_count = 0
 
     prev_id = -1
     has_version = False
 
-    for lineno, line in enumerate(lines, start=1):
-        line = line.strip()
+    # Validator and record parser for each line type, keyed by line prefix.
+    # V:, N:, F:, E: and D: lines are handled inline.
+    line_handlers: dict[str, tuple[LineValidator, LineParser]] = {
+        "S:": (validate_s_line, parse_s_line),
+        "I:": (validate_i_line, parse_i_line),
+        "H:": (validate_h_line, parse_h_line),
+        "W:": (validate_w_line, parse_w_line),
+        "C:": (validate_c_line, parse_c_line),
+    }
+
+    with f:
+        # Walk the raw lines; only data lines are decoded
+        for lineno, raw_line in enumerate(iter_lines(f), start=1):
+            # Skip comments with a single character test
+            if raw_line[:1] == b"#":
+                continue
 
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
+            # Drop carriage returns and trailing whitespace (see iter_lines())
+            raw_line = raw_line.replace(b"\r", b"").rstrip()
 
-        # Version stamp
-        if line.startswith("V:"):
-            has_version = True
-            continue
+            # Skip empty lines, and comments that followed a carriage return
+            if not raw_line or raw_line[:1] == b"#":
+                continue
 
-        # N: line - start of race entry
-        if line.startswith("N:"):
-            race_id = validate_n_line(line, lineno, result)
-            if race_id is not None:
-                # Check for duplicates
-                if race_id in ids_seen:
-                    result.error(
-                        f"Line {lineno}: Duplicate ID {race_id} "
-                        + f"(first seen at line {ids_seen[race_id]})"
-                    )
+            line = raw_line.decode("latin-1")
+
+            # Every record is a one-letter code and a colon, so dispatch on that
+            prefix = line[:2]
+
+            # Version stamp
+            if prefix == "V:":
+                has_version = True
+                continue
+
+            # N: line - start of race entry
+            if prefix == "N:":
+                # Save previous race
+                if current_race is not None:
+                    if description_parts:
+                        current_race.description = " ".join(description_parts)
+                    races.append(current_race)
+
+                parts = line.split(":")
+                if validate:
+                    race_id = validate_n_line(parts, line, lineno, result)
+                elif len(parts) >= 3 and parts[1].isdigit():
+                    # The fields validate_n_line() requires, without reporting
+                    race_id = int(parts[1])
                 else:
-                    ids_seen[race_id] = lineno
+                    race_id = None
+
+                if validate and race_id is not None:
+                    # Check for duplicates
+                    if race_id < len(first_lines):
+                        first_line = first_lines[race_id]
+                        if not first_line:
+                            first_lines[race_id] = lineno
+                    else:
+                        first_line = first_lines_overflow.setdefault(race_id, 0)
+                        if not first_line:
+                            first_lines_overflow[race_id] = lineno
+                    if first_line:
+                        result.error(
+                            f"Line {lineno}: Duplicate ID {race_id} "
+                            + f"(first seen at line {first_line})"
+                        )
+                    else:
+                        race_count += 1
+
+                    # Check IDs are increasing
+                    if race_id <= prev_id:
+                        result.error(
+                            f"Line {lineno}: ID {race_id} is not greater than previous ID {prev_id} "
+                            + "(IDs must be strictly increasing)"
+                        )
+                    prev_id = race_id
+
+                    # Check ID against limit
+                    if limits and race_id > limits.max_race_id:
+                        result.error(
+                            f"Line {lineno}: Race ID {race_id} exceeds maximum allowed ID "
+                            + f"{limits.max_race_id} (from limits.txt M:P:{limits.max_player_races})"
+                        )
+
+                if build_records and race_id is not None:
+                    current_race = Race(id=race_id, name=parts[2])
+                    description_parts = []
+                continue
 
-                # Check IDs are increasing
-                if race_id <= prev_id:
+            # Other line types
+            handler = line_handlers.get(prefix)
+            if handler is not None:
+                validate_line, parse_line = handler
+                # Only lines with fields are split, once for both handlers
+                parts = line.split(":")
+                if validate:
+                    validate_line(parts, line, lineno, result)
+                if current_race is not None:
+                    parse_line(parts, current_race)
+            elif prefix == "F:":
+                # F: lines are free-form flags, no strict validation needed
+                if current_race is not None:
+                    parse_f_line(line, current_race)
+            elif prefix == "E:":
+                # E: lines may carry an inline comment; drop it, then split once
+                line = line.partition("#")[0].strip()
+                parts = line.split(":")
+                if validate:
+                    validate_e_line(parts, line, lineno, result)
+                if current_race is not None:
+                    equip = parse_equipment(parts)
+                    if equip:
+                        current_race.equipment.append(equip)
+            elif prefix == "D:":
+                # D: lines are descriptions, no strict validation needed
+                if current_race is not None:
+                    description_parts.append(line[2:].strip())
+            elif validate:
+                # Check for unknown line types (letter followed by colon)
+                if len(line) >= 2 and line[1] == ":":
+                    result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
+                else:
                     result.error(
-                        f"Line {lineno}: ID {race_id} is not greater than previous ID {prev_id} "
-                        + "(IDs must be strictly increasing)"
+                        f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
                     )
-                prev_id = race_id
 
-                # Check ID against limit
-                if limits and race_id > limits.max_race_id:
-                    result.error(
-                        f"Line {lineno}: Race ID {race_id} exceeds maximum allowed ID "
-                        + f"{limits.max_race_id} (from limits.txt M:P:{limits.max_player_races})"
-                    )
-            continue
-
-        # Other line types
-        if line.startswith("S:"):
-            validate_s_line(line, lineno, result)
-        elif line.startswith("I:"):
-            validate_i_line(line, lineno, result)
-        elif line.startswith("H:"):
-            validate_h_line(line, lineno, result)
-        elif line.startswith("W:"):
-            validate_w_line(line, lineno, result)
-        elif line.startswith("C:"):
-            validate_c_line(line, lineno, result)
-        elif line.startswith("F:"):
-            pass  # F: lines are free-form flags, no strict validation needed
-        elif line.startswith("E:"):
-            validate_e_line(line, lineno, result)
-        elif line.startswith("D:"):
-            pass  # D: lines are descriptions, no strict validation needed
-        else:
-            # Check for unknown line types (letter followed by colon)
-            if len(line) >= 2 and line[1] == ":":
-                result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
-            else:
-                result.error(
-                    f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
-                )
+    if current_race is not None:
+        if description_parts:
+            current_race.description = " ".join(description_parts)
+        races.append(current_race)
 
     # Check for required version stamp
-    if not has_version:
+    if validate and not has_version:
         result.error("Missing required version stamp (V: line)")
 
     # Check total race count against limit
     if limits:
-        race_count = len(ids_seen)
         if race_count > limits.max_player_races:
             result.error(
                 f"Total race count ({race_count}) exceeds maximum allowed "
                 + f"({limits.max_player_races}) from limits.txt M:P"
             )
 
-    return result
+    return races, result
+
+
+class RaceEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Race records and their parts directly.
+
+    Each record is converted as the encoder reaches it, omitting unset values
+    and empty lists, so no intermediate list of dicts is built for the export.
+    """
+
+    @override
+    def default(self, o: object) -> object:
+        if isinstance(o, Race):
+            d: dict[str, object] = {"id": o.id}
+            if o.name:
+                d["name"] = o.name
+            for key in RACE_INT_FIELDS:
+                value = cast(int | None, getattr(o, key))
+                if value is not None:
+                    d[key] = value
+            if o.houses:
+                d["houses"] = o.houses
+            if o.flags:
+                d["flags"] = sorted(o.flags)
+            if o.equipment:
+                d["equipment"] = o.equipment
+            if o.description:
+                d["description"] = o.description
+            return d
+        if isinstance(o, Equipment):
+            return {
+                "tval": o.tval,
+                "sval": o.sval,
+                "min_amount": o.min_amount,
+                "max_amount": o.max_amount,
+            }
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def export_races_to_json(races: list[Race], fp: TextIO) -> None:
+    """Export races as JSON to a text file object."""
+    _ = fp.write(json.dumps({"races": races}, cls=RaceEncoder, indent=2, ensure_ascii=False))
+    _ = fp.write("\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -517,6 +601,7 @@ Examples:
   %(prog)s --validate lib/edit/race.txt  # Validate a specific file
   %(prog)s --export-json                 # Export to JSON (stdout)
   %(prog)s --export-json > races.json    # Export to JSON file
+  %(prog)s --validate --export-json      # Validate, then export to JSON (stdout)
 """,
     )
     _ = parser.add_argument(
@@ -538,24 +623,33 @@ Examples:
     return parser.parse_args()
 
 
-def run_validation(race_file: Path, limits_file: Path) -> int:
-    """Run validation on the race file."""
-    print("=" * 60)
-    print(f"Validating: {race_file}")
+def run_validation(race_file: Path, limits_file: Path, export_json: bool = False) -> int:
+    """Run validation on the race file.
+
+    With export_json, the races from the same parse are also exported to JSON
+    on stdout, and the validation report goes to stderr instead.
+    """
+    out = sys.stderr if export_json else sys.stdout
+
+    print("=" * 60, file=out)
+    print(f"Validating: {race_file}", file=out)
 
     # Parse limits file
     limits = parse_limits_file(limits_file)
     if limits:
-        print(f"Limits: max player races = {limits.max_player_races} (max ID = {limits.max_race_id})")
+        print(
+            f"Limits: max player races = {limits.max_player_races} (max ID = {limits.max_race_id})",
+            file=out,
+        )
     else:
         print(f"WARNING: Could not parse limits from {limits_file}", file=sys.stderr)
 
     # Validate the file
-    result = validate_race_file(race_file, limits)
+    races, result = parse_race_file(race_file, limits, build_records=export_json)
 
     # Print all messages of the validation result
     for msg in result.info:
-        print(f"INFO: {msg}")
+        print(f"INFO: {msg}", file=out)
 
     for msg in result.warnings:
         print(f"WARNING: {msg}", file=sys.stderr)
@@ -564,28 +658,34 @@ def run_validation(race_file: Path, limits_file: Path) -> int:
         print(f"ERROR: {msg}", file=sys.stderr)
 
     # Summary
-    print("=" * 60)
-    print(f"  Errors:   {len(result.errors)}")
-    print(f"  Warnings: {len(result.warnings)}")
-    print("=" * 60)
+    print("=" * 60, file=out)
+    print(f"  Errors:   {len(result.errors)}", file=out)
+    print(f"  Warnings: {len(result.warnings)}", file=out)
+    print("=" * 60, file=out)
 
     if result.is_valid:
-        print("OK")
+        print("OK", file=out)
     else:
-        print("FAILED")
+        print("FAILED", file=out)
+
+    if export_json:
+        if not races:
+            print(f"ERROR: No races found in {race_file}", file=sys.stderr)
+            return 1
+        export_races_to_json(races, sys.stdout)
 
     return 0 if result.is_valid else 1
 
 
 def run_export_json(race_file: Path) -> int:
     """Export races to JSON on stdout."""
-    races = parse_races(race_file)
+    races, _ = parse_race_file(race_file, validate=False)
 
     if not races:
         print(f"ERROR: No races found in {race_file}", file=sys.stderr)
         return 1
 
-    print(export_races_to_json(races))
+    export_races_to_json(races, sys.stdout)
     return 0
 
 
@@ -607,7 +707,8 @@ def main() -> int:
     export_json = cast(bool, args.export_json)
 
     if validate:
-        return run_validation(race_file, limits_file)
+        # Both flags share one parse: report on stderr, JSON on stdout
+        return run_validation(race_file, limits_file, export_json=export_json)
 
     if export_json:
         return run_export_json(race_file)
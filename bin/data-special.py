@@ -27,23 +27,28 @@ Exit codes:
 
 import argparse
 import json
+import mmap
+import os
 import re
 import signal
+import stat
 import sys
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO, TextIO, cast, override
 
-# JSON-compatible types
-type JsonValue = str | int | float | bool | None | list[JsonValue] | dict[str, JsonValue]
-type JsonDict = dict[str, JsonValue]
+# Per-line-type handlers, see parse_special_file()
+type LineValidator = Callable[[list[str], str, int, ValidationResult], None]
+type LineParser = Callable[[list[str], Special], None]
 
 # Handle broken pipe (e.g., when piping to head) - Unix only
 if hasattr(signal, "SIGPIPE"):
     _ = signal.signal(signal.SIGPIPE, signal.SIG_DFL)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
@@ -63,7 +68,7 @@ class ValidationResult:
         return len(self.errors) == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Limits:
     """Limits parsed from lib/edit/limits.txt."""
 
@@ -81,7 +86,7 @@ class Limits:
         return self.max_abilities - 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TvalRange:
     """A tval/sval range entry (T: line)."""
 
@@ -90,7 +95,7 @@ class TvalRange:
     max_sval: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityRef:
     """An ability reference (B: line)."""
 
@@ -98,7 +103,7 @@ class AbilityRef:
     ability_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Special:
     """A special item record parsed from special.txt."""
 
@@ -120,8 +125,30 @@ class Special:
     flags: list[str] = field(default_factory=list)
 
 
-# Regex pattern for ability format
-ABILITY_PATTERN = re.compile(r"^\d+/\d+$")
+# Optional integer fields of a Special, in JSON export order
+SPECIAL_INT_FIELDS = (
+    "max_att",
+    "plus_damage_dice",
+    "plus_damage_sides",
+    "max_evn",
+    "plus_prot_dice",
+    "plus_prot_sides",
+    "pval",
+    "depth",
+    "rarity",
+    "max_depth",
+    "cost",
+)
+
+###
+### Regex patterns, all compiled once at import time
+###
+# M:E: and M:B: lines of limits.txt
+LIMITS_PATTERN = re.compile(r"^\s*M:([EB]):(\d+)(?::.*)?\s*$", re.MULTILINE)
+# Signed integer (C: values)
+INTEGER_PATTERN = re.compile(r"^-?\d+$")
+# Ability format, capturing skill_id and ability_id
+ABILITY_PATTERN = re.compile(r"^(\d+)/(\d+)$")
 
 
 def parse_limits_file(filepath: Path) -> Limits | None:
@@ -132,21 +159,13 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     if not filepath.exists():
         return None
 
-    max_special_types = None
-    max_abilities = None
-
-    for line in filepath.read_text(encoding="latin-1").splitlines():
-        line = line.strip()
-        if line.startswith("M:E:"):
-            # M:E:145 - Maximum number of special item types
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_special_types = int(parts[2])
-        elif line.startswith("M:B:"):
-            # M:B:240 - Maximum number of abilities
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[2].isdigit():
-                max_abilities = int(parts[2])
+    # M:E:145 - Maximum number of special item types
+    # M:B:240 - Maximum number of abilities
+    # A single regex scan over the whole file; later lines override earlier ones.
+    text = filepath.read_text(encoding="latin-1")
+    values = {match[1]: int(match[2]) for match in LIMITS_PATTERN.finditer(text)}
+    max_special_types = values.get("E")
+    max_abilities = values.get("B")
 
     if max_special_types is None or max_abilities is None:
         return None
@@ -154,9 +173,31 @@ def parse_limits_file(filepath: Path) -> Limits | None:
     return Limits(max_special_types=max_special_types, max_abilities=max_abilities)
 
 
-def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | None:
+def iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the raw lines of an open file through a read-only memory map.
+
+    The file is never copied into one large buffer; each line is sliced out
+    of the map as it is consumed, and callers decode only the lines they keep.
+    A pipe or other non-regular file cannot be mapped and is read line by line.
+
+    As in the game, a line ends only at a newline. Callers drop carriage
+    returns anywhere in it (the game skips control characters) and trailing
+    whitespace, but keep leading whitespace: records start in column 0, and
+    the game rejects indented lines.
+    """
+    st = os.fstat(f.fileno())
+    if not stat.S_ISREG(st.st_mode):
+        yield from f
+        return
+    # mmap cannot map an empty file
+    if st.st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def validate_n_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> int | None:
     """Validate N: line format and return the ID."""
-    parts = line.split(":")
     if len(parts) < 3:
         result.error(f"Line {lineno}: N: line has {len(parts)} fields, expected at least 3: {line}")
         return None
@@ -169,9 +210,8 @@ def validate_n_line(line: str, lineno: int, result: ValidationResult) -> int | N
     return int(id_str)
 
 
-def validate_c_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_c_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate C: line format (7 creation bonus values)."""
-    parts = line.split(":")
     if len(parts) != 8:
         result.error(f"Line {lineno}: C: line has {len(parts)} fields, expected 8: {line}")
         return
@@ -187,13 +227,12 @@ def validate_c_line(line: str, lineno: int, result: ValidationResult) -> None:
     ]
     for i, name in enumerate(field_names, start=1):
         val = parts[i]
-        if not re.match(r"^-?\d+$", val):
+        if not INTEGER_PATTERN.match(val):
             result.error(f"Line {lineno}: C: {name} is not a valid integer: {val}")
 
 
-def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_w_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate W: line format (depth : rarity : max_depth : cost)."""
-    parts = line.split(":")
     if len(parts) != 5:
         result.error(f"Line {lineno}: W: line has {len(parts)} fields, expected 5: {line}")
         return
@@ -204,9 +243,8 @@ def validate_w_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: W: {name} is not numeric: {val}")
 
 
-def validate_t_line(line: str, lineno: int, result: ValidationResult) -> None:
+def validate_t_line(parts: list[str], line: str, lineno: int, result: ValidationResult) -> None:
     """Validate T: line format (tval : min_sval : max_sval)."""
-    parts = line.split(":")
     if len(parts) != 4:
         result.error(f"Line {lineno}: T: line has {len(parts)} fields, expected 4: {line}")
         return
@@ -217,21 +255,23 @@ def validate_t_line(line: str, lineno: int, result: ValidationResult) -> None:
             result.error(f"Line {lineno}: T: {name} is not numeric: {val}")
 
 
-def validate_b_line(line: str, lineno: int, result: ValidationResult, limits: Limits | None) -> None:
+def validate_b_line(
+    parts: list[str], line: str, lineno: int, result: ValidationResult, limits: Limits | None
+) -> None:
     """Validate B: line format (ability references)."""
-    parts = line.split(":")
     if len(parts) != 2:
         result.error(f"Line {lineno}: B: line has {len(parts)} fields, expected 2: {line}")
         return
 
     ability_str = parts[1]
-    if not ABILITY_PATTERN.match(ability_str):
+    match = ABILITY_PATTERN.match(ability_str)
+    if not match:
         result.error(f"Line {lineno}: B: invalid ability format '{ability_str}', expected X/Y")
         return
 
     # Validate ability IDs are within limits
     if limits:
-        _, ability_id = map(int, ability_str.split("/"))
+        ability_id = int(match.group(2))
         if ability_id > limits.max_ability_id:
             result.error(
                 f"Line {lineno}: B: ability_id {ability_id} exceeds max {limits.max_ability_id}"
@@ -240,246 +280,281 @@ def validate_b_line(line: str, lineno: int, result: ValidationResult, limits: Li
 
 def parse_ability(ability_str: str) -> AbilityRef | None:
     """Parse an ability string like "0/5" into an AbilityRef object."""
-    if ABILITY_PATTERN.match(ability_str):
-        skill_id, ability_id = map(int, ability_str.split("/"))
-        return AbilityRef(skill_id=skill_id, ability_id=ability_id)
+    match = ABILITY_PATTERN.match(ability_str)
+    if match:
+        return AbilityRef(skill_id=int(match.group(1)), ability_id=int(match.group(2)))
     return None
 
 
-def parse_specials(filepath: Path) -> list[Special]:
-    """Parse special.txt and return a list of Special objects."""
-    if not filepath.exists():
-        return []
-
-    lines = filepath.read_text(encoding="latin-1").splitlines()
-    specials: list[Special] = []
-    current_special: Special | None = None
-
-    for line in lines:
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#") or line.startswith("V:"):
-            continue
-
-        # N: line - start of new special item
-        if line.startswith("N:"):
-            # Save previous special
-            if current_special is not None:
-                specials.append(current_special)
-
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[1].isdigit():
-                # Join remaining parts for name (in case name contains colons)
-                name = ":".join(parts[2:])
-                current_special = Special(id=int(parts[1]), name=name)
-            continue
+def parse_c_line(parts: list[str], special: Special) -> None:
+    """Apply C: creation bonuses (7 values) to a special item."""
+    if len(parts) >= 8:
+        if INTEGER_PATTERN.match(parts[1]):
+            special.max_att = int(parts[1])
+        if INTEGER_PATTERN.match(parts[2]):
+            special.plus_damage_dice = int(parts[2])
+        if INTEGER_PATTERN.match(parts[3]):
+            special.plus_damage_sides = int(parts[3])
+        if INTEGER_PATTERN.match(parts[4]):
+            special.max_evn = int(parts[4])
+        if INTEGER_PATTERN.match(parts[5]):
+            special.plus_prot_dice = int(parts[5])
+        if INTEGER_PATTERN.match(parts[6]):
+            special.plus_prot_sides = int(parts[6])
+        if INTEGER_PATTERN.match(parts[7]):
+            special.pval = int(parts[7])
+
+
+def parse_int(value: str) -> int | None:
+    """Convert a field with a single int() call, returning None if it is not an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
-        if current_special is None:
-            continue
 
-        # C: creation bonuses (7 values)
-        if line.startswith("C:"):
-            parts = line.split(":")
-            if len(parts) >= 8:
-                if re.match(r"^-?\d+$", parts[1]):
-                    current_special.max_att = int(parts[1])
-                if re.match(r"^-?\d+$", parts[2]):
-                    current_special.plus_damage_dice = int(parts[2])
-                if re.match(r"^-?\d+$", parts[3]):
-                    current_special.plus_damage_sides = int(parts[3])
-                if re.match(r"^-?\d+$", parts[4]):
-                    current_special.max_evn = int(parts[4])
-                if re.match(r"^-?\d+$", parts[5]):
-                    current_special.plus_prot_dice = int(parts[5])
-                if re.match(r"^-?\d+$", parts[6]):
-                    current_special.plus_prot_sides = int(parts[6])
-                if re.match(r"^-?\d+$", parts[7]):
-                    current_special.pval = int(parts[7])
-
-        # W: depth : rarity : max_depth : cost
-        elif line.startswith("W:"):
-            parts = line.split(":")
-            if len(parts) >= 5:
-                if parts[1].isdigit():
-                    current_special.depth = int(parts[1])
-                if parts[2].isdigit():
-                    current_special.rarity = int(parts[2])
-                if parts[3].isdigit():
-                    current_special.max_depth = int(parts[3])
-                if parts[4].isdigit():
-                    current_special.cost = int(parts[4])
-
-        # T: tval : min_sval : max_sval
-        elif line.startswith("T:"):
-            parts = line.split(":")
-            if len(parts) >= 4:
-                if parts[1].isdigit() and parts[2].isdigit() and parts[3].isdigit():
-                    current_special.tval_ranges.append(
-                        TvalRange(
-                            tval=int(parts[1]),
-                            min_sval=int(parts[2]),
-                            max_sval=int(parts[3]),
-                        )
-                    )
+def parse_w_line(parts: list[str], special: Special) -> None:
+    """Apply W: depth : rarity : max_depth : cost to a special item."""
+    if len(parts) >= 5:
+        if (depth := parse_int(parts[1])) is not None:
+            special.depth = depth
+        if (rarity := parse_int(parts[2])) is not None:
+            special.rarity = rarity
+        if (max_depth := parse_int(parts[3])) is not None:
+            special.max_depth = max_depth
+        if (cost := parse_int(parts[4])) is not None:
+            special.cost = cost
+
+
+def parse_t_line(parts: list[str], special: Special) -> None:
+    """Apply T: tval : min_sval : max_sval to a special item."""
+    if len(parts) >= 4:
+        try:
+            tval_range = TvalRange(
+                tval=int(parts[1]),
+                min_sval=int(parts[2]),
+                max_sval=int(parts[3]),
+            )
+        except ValueError:
+            return
+        special.tval_ranges.append(tval_range)
 
-        # B: ability reference
-        elif line.startswith("B:"):
-            parts = line.split(":")
-            if len(parts) >= 2:
-                ability = parse_ability(parts[1])
-                if ability:
-                    current_special.abilities.append(ability)
 
-        # F: flags
-        elif line.startswith("F:"):
-            content = line[2:]  # Remove "F:"
-            flags = [f.strip() for f in content.split("|") if f.strip()]
-            current_special.flags.extend(flags)
+def parse_b_line(parts: list[str], special: Special) -> None:
+    """Apply a B: ability reference to a special item."""
+    if len(parts) >= 2:
+        ability = parse_ability(parts[1])
+        if ability:
+            special.abilities.append(ability)
 
-    if current_special is not None:
-        specials.append(current_special)
 
-    return specials
+def parse_f_line(line: str, special: Special) -> None:
+    """Apply F: flags to a special item."""
+    content = line[2:]  # Remove "F:"
+    flags = [f.strip() for f in content.split("|") if f.strip()]
+    special.flags.extend(flags)
 
 
-def export_specials_to_json(specials: list[Special]) -> str:
-    """Export specials to a JSON string."""
+def parse_special_file(
+    filepath: Path,
+    limits: Limits | None = None,
+    *,
+    validate: bool = True,
+    build_records: bool = True,
+) -> tuple[list[Special], ValidationResult]:
+    """Parse and/or validate the entire special.txt file in a single pass.
 
-    def clean_dict(d: JsonDict) -> JsonDict:
-        """Recursively remove None values and empty collections from a dict."""
-        result: JsonDict = {}
-        for k, v in d.items():
-            if v is None or v == [] or v == "":
-                continue
-            if isinstance(v, dict):
-                cleaned = clean_dict(v)
-                if cleaned:  # Only include non-empty dicts
-                    result[k] = cleaned
-            elif isinstance(v, list):
-                # Clean each item if it's a dict
-                cleaned_list: list[JsonValue] = []
-                for item in v:
-                    if isinstance(item, dict):
-                        cleaned_item = clean_dict(item)
-                        if cleaned_item:
-                            cleaned_list.append(cleaned_item)
-                    elif item is not None:
-                        cleaned_list.append(item)
-                if cleaned_list:
-                    result[k] = cleaned_list
-            else:
-                result[k] = v
-        return result
-
-    def special_to_dict(special: Special) -> JsonDict:
-        """Convert a Special to a dict, removing None values."""
-        d = clean_dict(asdict(special))
-        if "flags" in d and isinstance(d["flags"], list):
-            d["flags"] = cast(JsonValue, sorted(cast(list[str], d["flags"])))
-        return d
-
-    data = {"specials": [special_to_dict(s) for s in specials]}
-    return json.dumps(data, indent=2, ensure_ascii=False)
-
-
-def validate_special_file(filepath: Path, limits: Limits | None = None) -> ValidationResult:
-    """Validate the entire special.txt file.
+    Each line is read and split once, then validated and applied to the
+    current special item record. Only the work for the requested modes is done.
 
     Args:
         filepath: Path to special.txt file.
         limits: Optional limits from limits.txt. If provided, validates
                 special item count and IDs against the maximum allowed.
+        validate: Whether to check the file format and integrity.
+        build_records: Whether to build the special item records.
+
+    Returns:
+        The parsed special item records (empty unless build_records is set)
+        and the validation result (without checks unless validate is set).
     """
     result = ValidationResult()
+    specials: list[Special] = []
 
     if not filepath.exists():
         result.error(f"Special file not found: {filepath}")
-        return result
+        return specials, result
 
-    lines = filepath.read_text(encoding="latin-1").splitlines()
+    current_special: Special | None = None
 
-    # Track state. Maps id -> line number.
-    ids_seen: dict[int, int] = {}
+    # Track state. Maps id -> line number of its first N: line (0 = unseen).
+    # IDs are dense and bounded by limits.txt, so those are tracked in a flat
+    # list indexed by ID; IDs beyond the limit (already an error) use a dict.
+    first_lines = [0] * limits.max_special_types if limits else []
+    first_lines_overflow: dict[int, int] = {}
+    special_count = 0
 
     prev_id = -1
     has_version = False
 
-    for lineno, line in enumerate(lines, start=1):
-        line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
-
-        # Version stamp
-        if line.startswith("V:"):
-            has_version = True
-            continue
-
-        # N: line - start of special item entry
-        if line.startswith("N:"):
-            special_id = validate_n_line(line, lineno, result)
-            if special_id is not None:
-                # Check for duplicates
-                if special_id in ids_seen:
-                    result.error(
-                        f"Line {lineno}: Duplicate ID {special_id} "
-                        + f"(first seen at line {ids_seen[special_id]})"
-                    )
+    # Validator and record parser for each line type, keyed by line prefix.
+    # N:, V: and F: lines are handled inline.
+    line_handlers: dict[str, tuple[LineValidator, LineParser]] = {
+        "C:": (validate_c_line, parse_c_line),
+        "W:": (validate_w_line, parse_w_line),
+        "T:": (validate_t_line, parse_t_line),
+        "B:": (partial(validate_b_line, limits=limits), parse_b_line),
+    }
+
+    # Bind the methods called in the loop once
+    error = result.error
+    append_special = specials.append
+
+    with filepath.open("rb") as f:
+        # Walk the raw lines; only data lines are decoded
+        for lineno, raw_line in enumerate(iter_lines(f), start=1):
+            # Drop carriage returns and trailing whitespace (see iter_lines())
+            raw_line = raw_line.replace(b"\r", b"").rstrip()
+
+            # Skip empty lines and comments before decoding
+            if raw_line[:1] in (b"", b"#"):
+                continue
+
+            line = raw_line.decode("latin-1")
+            prefix = line[:2]
+            parts = line.split(":")
+
+            # Version stamp
+            if prefix == "V:":
+                has_version = True
+                continue
+
+            # N: line - start of special item entry
+            if prefix == "N:":
+                # Save previous special
+                if current_special is not None:
+                    append_special(current_special)
+
+                if validate:
+                    special_id = validate_n_line(parts, line, lineno, result)
+                elif len(parts) >= 3 and parts[1].isdigit():
+                    # The fields validate_n_line() requires, without reporting
+                    special_id = int(parts[1])
                 else:
-                    ids_seen[special_id] = lineno
+                    special_id = None
+
+                if validate and special_id is not None:
+                    # Check for duplicates
+                    if special_id < len(first_lines):
+                        first_line = first_lines[special_id]
+                        if not first_line:
+                            first_lines[special_id] = lineno
+                    else:
+                        first_line = first_lines_overflow.setdefault(special_id, 0)
+                        if not first_line:
+                            first_lines_overflow[special_id] = lineno
+                    if first_line:
+                        error(
+                            f"Line {lineno}: Duplicate ID {special_id} "
+                            + f"(first seen at line {first_line})"
+                        )
+                    else:
+                        special_count += 1
+
+                    # Check IDs are increasing
+                    if special_id <= prev_id:
+                        error(
+                            f"Line {lineno}: ID {special_id} is not greater than previous ID {prev_id} "
+                            + "(IDs must be strictly increasing)"
+                        )
+                    prev_id = special_id
 
-                # Check IDs are increasing
-                if special_id <= prev_id:
-                    result.error(
-                        f"Line {lineno}: ID {special_id} is not greater than previous ID {prev_id} "
-                        + "(IDs must be strictly increasing)"
-                    )
-                prev_id = special_id
+                    # Check ID against limit
+                    if limits and special_id > limits.max_special_id:
+                        error(
+                            f"Line {lineno}: Special ID {special_id} exceeds maximum allowed ID "
+                            + f"{limits.max_special_id} (from limits.txt M:E:{limits.max_special_types})"
+                        )
+
+                if build_records and special_id is not None:
+                    # Join remaining parts for name (in case name contains colons)
+                    current_special = Special(id=special_id, name=":".join(parts[2:]))
+                continue
 
-                # Check ID against limit
-                if limits and special_id > limits.max_special_id:
-                    result.error(
-                        f"Line {lineno}: Special ID {special_id} exceeds maximum allowed ID "
-                        + f"{limits.max_special_id} (from limits.txt M:E:{limits.max_special_types})"
+            # Other line types
+            handler = line_handlers.get(prefix)
+            if handler is not None:
+                validate_line, parse_line = handler
+                if validate:
+                    validate_line(parts, line, lineno, result)
+                if current_special is not None:
+                    parse_line(parts, current_special)
+            elif prefix == "F:":
+                # F: lines are free-form flags, no strict validation needed
+                if current_special is not None:
+                    parse_f_line(line, current_special)
+            elif validate:
+                # Check for unknown line types (letter followed by colon)
+                if len(line) >= 2 and line[1] == ":":
+                    error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
+                else:
+                    error(
+                        f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
                     )
-            continue
-
-        # Other line types
-        if line.startswith("C:"):
-            validate_c_line(line, lineno, result)
-        elif line.startswith("W:"):
-            validate_w_line(line, lineno, result)
-        elif line.startswith("T:"):
-            validate_t_line(line, lineno, result)
-        elif line.startswith("B:"):
-            validate_b_line(line, lineno, result, limits)
-        elif line.startswith("F:"):
-            pass  # F: lines are free-form flags, no strict validation needed
-        else:
-            # Check for unknown line types (letter followed by colon)
-            if len(line) >= 2 and line[1] == ":":
-                result.error(f"Line {lineno}: Unknown line type '{line[0]}:' in line '{line}'")
-            else:
-                result.error(
-                    f"Line {lineno}: Unrecognized line (missing '#' comment marker?): '{line}'"
-                )
+
+    if current_special is not None:
+        specials.append(current_special)
 
     # Check for required version stamp
-    if not has_version:
+    if validate and not has_version:
         result.error("Missing required version stamp (V: line)")
 
     # Check total special count against limit
     if limits:
-        special_count = len(ids_seen)
         if special_count > limits.max_special_types:
             result.error(
                 f"Total special count ({special_count}) exceeds maximum allowed "
                 + f"({limits.max_special_types}) from limits.txt M:E"
             )
 
-    return result
+    return specials, result
+
+
+class SpecialEncoder(json.JSONEncoder):
+    """JSON encoder that serializes Special records and their parts directly.
+
+    Each record is converted as the encoder reaches it, omitting unset values
+    and empty lists, so no intermediate list of dicts is built for the export.
+    """
+
+    @override
+    def default(self, o: object) -> object:
+        if isinstance(o, Special):
+            d: dict[str, object] = {"id": o.id}
+            if o.name:
+                d["name"] = o.name
+            for key in SPECIAL_INT_FIELDS:
+                value = cast(int | None, getattr(o, key))
+                if value is not None:
+                    d[key] = value
+            if o.tval_ranges:
+                d["tval_ranges"] = o.tval_ranges
+            if o.abilities:
+                d["abilities"] = o.abilities
+            if o.flags:
+                d["flags"] = sorted(o.flags)
+            return d
+        if isinstance(o, TvalRange):
+            return {"tval": o.tval, "min_sval": o.min_sval, "max_sval": o.max_sval}
+        if isinstance(o, AbilityRef):
+            return {"skill_id": o.skill_id, "ability_id": o.ability_id}
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def export_specials_to_json(specials: list[Special], fp: TextIO) -> None:
+    """Export specials as JSON to a text file object."""
+    _ = fp.write(json.dumps({"specials": specials}, cls=SpecialEncoder, indent=2, ensure_ascii=False))
+    _ = fp.write("\n")
 
 
 def parse_args() -> argparse.Namespace:
@@ -492,6 +567,7 @@ Examples:
   %(prog)s --validate lib/edit/special.txt  # Validate a specific file
   %(prog)s --export-json                    # Export to JSON (stdout)
   %(prog)s --export-json > specials.json    # Export to JSON file
+  %(prog)s --validate --export-json         # Validate, then export to JSON (stdout)
 """,
     )
     _ = parser.add_argument(
@@ -513,24 +589,33 @@ Examples:
     return parser.parse_args()
 
 
-def run_validation(special_file: Path, limits_file: Path) -> int:
-    """Run validation on the special file."""
-    print("=" * 60)
-    print(f"Validating: {special_file}")
+def run_validation(special_file: Path, limits_file: Path, export_json: bool = False) -> int:
+    """Run validation on the special file.
+
+    With export_json, the specials from the same parse are also exported to JSON
+    on stdout, and the validation report goes to stderr instead.
+    """
+    out = sys.stderr if export_json else sys.stdout
+
+    print("=" * 60, file=out)
+    print(f"Validating: {special_file}", file=out)
 
     # Parse limits file
     limits = parse_limits_file(limits_file)
     if limits:
-        print(f"Limits: max special types = {limits.max_special_types} (max ID = {limits.max_special_id})")
+        print(
+            f"Limits: max special types = {limits.max_special_types} (max ID = {limits.max_special_id})",
+            file=out,
+        )
     else:
         print(f"WARNING: Could not parse limits from {limits_file}", file=sys.stderr)
 
     # Validate the file
-    result = validate_special_file(special_file, limits)
+    specials, result = parse_special_file(special_file, limits, build_records=export_json)
 
     # Print all messages of the validation result
     for msg in result.info:
-        print(f"INFO: {msg}")
+        print(f"INFO: {msg}", file=out)
 
     for msg in result.warnings:
         print(f"WARNING: {msg}", file=sys.stderr)
@@ -539,28 +624,34 @@ def run_validation(special_file: Path, limits_file: Path) -> int:
         print(f"ERROR: {msg}", file=sys.stderr)
 
     # Summary
-    print("=" * 60)
-    print(f"  Errors:   {len(result.errors)}")
-    print(f"  Warnings: {len(result.warnings)}")
-    print("=" * 60)
+    print("=" * 60, file=out)
+    print(f"  Errors:   {len(result.errors)}", file=out)
+    print(f"  Warnings: {len(result.warnings)}", file=out)
+    print("=" * 60, file=out)
 
     if result.is_valid:
-        print("OK")
+        print("OK", file=out)
     else:
-        print("FAILED")
+        print("FAILED", file=out)
+
+    if export_json:
+        if not specials:
+            print(f"ERROR: No specials found in {special_file}", file=sys.stderr)
+            return 1
+        export_specials_to_json(specials, sys.stdout)
 
     return 0 if result.is_valid else 1
 
 
 def run_export_json(special_file: Path) -> int:
     """Export specials to JSON on stdout."""
-    specials = parse_specials(special_file)
+    specials, _ = parse_special_file(special_file, validate=False)
 
     if not specials:
         print(f"ERROR: No specials found in {special_file}", file=sys.stderr)
         return 1
 
-    print(export_specials_to_json(specials))
+    export_specials_to_json(specials, sys.stdout)
     return 0
 
 
@@ -582,7 +673,8 @@ def main() -> int:
     export_json = cast(bool, args.export_json)
 
     if validate:
-        return run_validation(special_file, limits_file)
+        # Both flags share one parse: report on stderr, JSON on stdout
+        return run_validation(special_file, limits_file, export_json=export_json)
 
     if export_json:
         return run_export_json(special_file)